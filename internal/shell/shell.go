@@ -63,6 +63,13 @@ type Job struct {
 	PID     int
 }
 
+// Variable expansion patterns, compiled once instead of on every expansion
+var (
+	braceVarRegex   = regexp.MustCompile(`\${([A-Za-z_][A-Za-z0-9_]*)}`)
+	dollarVarRegex  = regexp.MustCompile(`\$([A-Za-z_][A-Za-z0-9_]*)`)
+	percentVarRegex = regexp.MustCompile(`%([A-Za-z_][A-Za-z0-9_]*)%`)
+)
+
 // New creates a new shell instance
 func New(config *Config) *Shell {
 	if config == nil {
@@ -204,6 +211,11 @@ func (s *Shell) expandVariables(input string) string {
 		}
 	}
 	
+	// Nothing to expand without a variable sigil
+	if !strings.ContainsAny(input, "$%") {
+		return input
+	}
+	
 	result := input
 	
 	// Create a combined variable map (shell variables + environment)
@@ -231,8 +243,7 @@ func (s *Shell) expandVariables(input string) string {
 	}
 	
 	// Expand ${VAR} format first (more specific)
-	braceRegex := regexp.MustCompile(`\${([A-Za-z_][A-Za-z0-9_]*)}`)
-	result = braceRegex.ReplaceAllStringFunc(result, func(match string) string {
+	result = braceVarRegex.ReplaceAllStringFunc(result, func(match string) string {
 		varName := match[2 : len(match)-1] // Remove ${ and }
 		if value, exists := allVars[varName]; exists {
 			return value
@@ -241,8 +252,7 @@ func (s *Shell) expandVariables(input string) string {
 	})
 	
 	// Expand $VAR format (word boundary aware)
-	dollarRegex := regexp.MustCompile(`\$([A-Za-z_][A-Za-z0-9_]*)`)
-	result = dollarRegex.ReplaceAllStringFunc(result, func(match string) string {
+	result = dollarVarRegex.ReplaceAllStringFunc(result, func(match string) string {
 		varName := match[1:] // Remove $
 		if value, exists := allVars[varName]; exists {
 			return value
@@ -251,8 +261,7 @@ func (s *Shell) expandVariables(input string) string {
 	})
 	
 	// Windows style %VAR%
-	percentRegex := regexp.MustCompile(`%([A-Za-z_][A-Za-z0-9_]*)%`)
-	result = percentRegex.ReplaceAllStringFunc(result, func(match string) string {
+	result = percentVarRegex.ReplaceAllStringFunc(result, func(match string) string {
 		varName := match[1 : len(match)-1] // Remove % and %
 		if value, exists := allVars[varName]; exists {
 			return value
@@ -4,41 +4,272 @@ CoderAgent - AI-powered code generation and manipulation
 
 import re
 import os
-import ast
-import json
-from pathlib import Path
-from typing import Dict, List, Optional, Any
+import string
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Any
+
+# Keyword tables for the single-pass scan in _parse_code_request
+REQUEST_TYPE_KEYWORDS = {
+    'class': 'class', 'object': 'class', 'struct': 'class',
+    'api': 'api', 'server': 'api', 'endpoint': 'api', 'rest': 'api',
+    'script': 'script', 'program': 'script', 'app': 'script',
+    'component': 'component', 'ui': 'component', 'interface': 'component',
+}
+REQUEST_TYPE_PRIORITY = ('class', 'api', 'script', 'component')
+# Verbs whose following word names the generated code, highest priority first
+NAME_VERB_PRIORITY = {'function': 0, 'def': 0, 'class': 0, 'create': 1, 'make': 2, 'build': 3}
+FEATURE_KEYWORDS = {
+    'validation': 'validation',
+    'logging': 'logging',
+    'async': 'async',
+    'asynchronous': 'async',
+}
+FEATURE_ORDER = ('validation', 'error_handling', 'logging', 'async')
+WORD_SEPARATORS = str.maketrans({c: ' ' for c in string.punctuation if c != '_'})
+
+# Prompt keywords per language, checked in order
+LANGUAGE_KEYWORDS = {
+    'python': ['python', 'django', 'flask', 'pandas', 'numpy'],
+    'javascript': ['javascript', 'js', 'node', 'express', 'npm'],
+    'typescript': ['typescript', 'ts'],
+    'react': ['react', 'jsx', 'component'],
+    'go': ['go', 'golang'],
+    'java': ['java', 'spring', 'maven'],
+    'cpp': ['c++', 'cpp'],
+    'rust': ['rust', 'cargo'],
+    'php': ['php', 'laravel'],
+    'ruby': ['ruby', 'rails']
+}
+LANGUAGE_RANK = {lang: rank for rank, lang in enumerate(LANGUAGE_KEYWORDS)}
+KEYWORD_LANGUAGE = {
+    keyword: lang
+    for lang, keywords in LANGUAGE_KEYWORDS.items()
+    for keyword in keywords
+}
+# Zero-width lookahead reports overlapping hits; alternatives are in rank order,
+# so each position yields its best-ranked keyword
+LANGUAGE_KEYWORD_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(keyword) for keyword in KEYWORD_LANGUAGE) + '))'
+)
+
+# Patterns compiled once at import time
+# One alternation per language so each explain() scans the code once
+PY_STRUCTURE_RE = re.compile(
+    r'^(?:import\s+(?P<imports>\w+)'
+    r'|from\s+(?P<from_imports>\w+)\s+import'
+    r'|def\s+(?P<functions>\w+)'
+    r'|class\s+(?P<classes>\w+))',
+    re.MULTILINE
+)
+JS_STRUCTURE_RE = re.compile(
+    r'function\s+(?P<functions>\w+)'
+    r'|const\s+(?P<arrow_functions>\w+)\s*=\s*\('
+)
+
+# Content-based language detection only looks at the head of the code
+LANGUAGE_SAMPLE_SIZE = 2048
+# 'function' before 'func' so the longer keyword wins at the same offset
+LANGUAGE_HINT_RE = re.compile(r'def |import |function|const|let|func|package|public class')
+
+@lru_cache(maxsize=256)
+def _detect_language_from_sample(sample: str) -> str:
+    """Detect language from a code sample, memoized across explain() calls"""
+    hints = set(LANGUAGE_HINT_RE.findall(sample))
+    if 'def ' in hints or 'import ' in hints:
+        return 'python'
+    elif 'function' in hints or 'const' in hints or 'let' in hints:
+        return 'javascript'
+    elif 'func' in hints and 'package' in hints:
+        return 'go'
+    elif 'public class' in hints:
+        return 'java'
+    else:
+        return 'text'
+
+def _python_structure(code: str) -> Dict[str, List[str]]:
+    """Collect top-level imports, functions and classes from Python source"""
+    import ast  # only the explain path needs the parser
+    
+    found = {'imports': [], 'from_imports': [], 'functions': [], 'classes': []}
+    
+    try:
+        tree = ast.parse(code)
+    except (SyntaxError, ValueError):
+        # Unparseable source still gets a best-effort regex scan
+        for match in PY_STRUCTURE_RE.finditer(code):
+            found[match.lastgroup].append(match.group(match.lastgroup))
+        return found
+    
+    # Module-level statements only, matching what the line-anchored scan reports
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            found['imports'].append(node.names[0].name.partition('.')[0])
+        elif isinstance(node, ast.ImportFrom):
+            if node.level == 0 and node.module:
+                found['from_imports'].append(node.module.partition('.')[0])
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            found['functions'].append(node.name)
+        elif isinstance(node, ast.ClassDef):
+            found['classes'].append(node.name)
+    
+    return found
+
+@lru_cache(maxsize=2048)
+def _python_file_structure(path: str, mtime_ns: int, size: int) -> Tuple[int, Mapping[str, Tuple[str, ...]]]:
+    """Line count and structure of a Python file, shared by every agent and thread"""
+    with open(path, 'r', encoding='utf-8') as f:
+        code = f.read()
+    found = _python_structure(code)
+    return len(code.splitlines()), MappingProxyType({k: tuple(v) for k, v in found.items()})
+
+# Languages whose explanation needs the decoded source
+STRUCTURED_LANGUAGES = frozenset({'python', 'javascript'})
+READ_CHUNK_SIZE = 1 << 20
+
+# Generator templates; feature blocks are substituted as values, so their braces are literal
+PY_FUNCTION_TEMPLATE = '''{imports}{async_kw}def {name}({params}):
+    """
+    {description}
+    """{validation}{logging}{body}'''
+PY_VALIDATION_BLOCK = '''
+
+    if not data:
+        raise ValueError("Data cannot be empty")'''
+PY_LOGGING_BLOCK = '''
+
+    import logging
+    logging.info(f"Processing {name}")'''
+PY_ERROR_HANDLING_BODY = '''
+
+    try:
+        # Process the data
+        result = process_data(data)
+        return result
+    except Exception as e:
+        logging.error(f"Error in {name}: {e}")
+        raise'''
+PY_TODO_BODY = '''
+
+    # TODO: Implement function logic
+    result = None
+
+    return result'''
+# Pre-baked common case: no features requested
+PY_PLAIN_FUNCTION_TEMPLATE = '''def {name}(data):
+    """
+    {description}
+    """''' + PY_TODO_BODY
+PY_CLASS_TEMPLATE = '''class {name}:
+    """
+    {description}
+    """
+
+    def __init__(self):
+        """Initialize the class"""
+        pass
+
+    def process(self, data):
+        """Process data"""
+        # TODO: Implement processing logic
+        return data'''
+JS_FUNCTION_TEMPLATE = '''{async_kw}function {name}(data) {{
+  /**
+   * {description}
+   */{validation}{logging}
+
+  // TODO: Implement function logic
+  const result = null;
+
+  return result;
+}}'''
+JS_VALIDATION_BLOCK = '''
+
+  if (!data) {
+    throw new Error("Data cannot be empty");
+  }'''
+JS_LOGGING_BLOCK = '''
+
+  console.log("Processing {name}");'''
+JS_CLASS_TEMPLATE = '''/**
+ * {description}
+ */
+class {name} {{
+
+  constructor() {{
+    // Initialize the class
+  }}
+
+  process(data) {{
+    // TODO: Implement processing logic
+    return data;
+  }}
+}}'''
+GO_FUNCTION_TEMPLATE = '''// {description}
+func {name}(data interface{{}}) (interface{{}}, error) {{
+    // TODO: Implement function logic
+    return nil, nil
+}}'''
+
+# Code templates, built once and shared read-only by every CoderAgent
+PYTHON_TEMPLATES = MappingProxyType({})  # Could be expanded
+JAVASCRIPT_TEMPLATES = MappingProxyType({})  # Could be expanded
+GO_TEMPLATES = MappingProxyType({})  # Could be expanded
+REACT_TEMPLATES = MappingProxyType({})  # Could be expanded
+CODE_TEMPLATES = MappingProxyType({
+    'python': PYTHON_TEMPLATES,
+    'javascript': JAVASCRIPT_TEMPLATES,
+    'go': GO_TEMPLATES,
+    'react': REACT_TEMPLATES,
+})
 
 class CoderAgent:
     """AI-powered coding agent for generation, refactoring, and explanation"""
     
+    # Shared by all instances; none of these are mutated after import
+    language_extensions = {
+        'python': ['.py'],
+        'javascript': ['.js'],
+        'typescript': ['.ts'],
+        'react': ['.jsx', '.tsx'],
+        'go': ['.go'],
+        'java': ['.java'],
+        'cpp': ['.cpp', '.cc', '.cxx'],
+        'c': ['.c'],
+        'csharp': ['.cs'],
+        'rust': ['.rs'],
+        'php': ['.php'],
+        'ruby': ['.rb'],
+        'sql': ['.sql'],
+        'html': ['.html', '.htm'],
+        'css': ['.css'],
+        'json': ['.json'],
+        'yaml': ['.yml', '.yaml'],
+        'markdown': ['.md'],
+    }
+    _ext_to_lang = {
+        ext: lang
+        for lang, extensions in language_extensions.items()
+        for ext in extensions
+    }
+    code_templates = CODE_TEMPLATES
+    
     def __init__(self):
-        self.language_extensions = {
-            'python': ['.py'],
-            'javascript': ['.js'],
-            'typescript': ['.ts'],
-            'react': ['.jsx', '.tsx'],
-            'go': ['.go'],
-            'java': ['.java'],
-            'cpp': ['.cpp', '.cc', '.cxx'],
-            'c': ['.c'],
-            'csharp': ['.cs'],
-            'rust': ['.rs'],
-            'php': ['.php'],
-            'ruby': ['.rb'],
-            'sql': ['.sql'],
-            'html': ['.html', '.htm'],
-            'css': ['.css'],
-            'json': ['.json'],
-            'yaml': ['.yml', '.yaml'],
-            'markdown': ['.md'],
+        self._generators = {
+            'function': self._generate_function,
+            'class': self._generate_class,
+            'api': self._generate_api,
+            'script': self._generate_script,
+            'component': self._generate_component,
         }
-        
-        self.code_templates = {
-            'python': self._get_python_templates(),
-            'javascript': self._get_javascript_templates(),
-            'go': self._get_go_templates(),
-            'react': self._get_react_templates()
+        self._function_generators = {
+            'python': self._generate_python_function,
+            'javascript': self._generate_javascript_function,
+            'go': self._generate_go_function,
+        }
+        self._class_generators = {
+            'python': self._generate_python_class,
+            'javascript': self._generate_javascript_class,
         }
     
     def generate(self, prompt: str, language: str = None, output_file: str = None) -> str:
@@ -49,21 +280,11 @@ class CoderAgent:
         
         # Determine language if not specified
         if not language:
-            language = self._detect_language_from_prompt(prompt)
+            language = self._detect_language_from_prompt(request['prompt_lower'])
         
         # Generate code based on request type
-        if request['type'] == 'function':
-            code = self._generate_function(request, language)
-        elif request['type'] == 'class':
-            code = self._generate_class(request, language)
-        elif request['type'] == 'api':
-            code = self._generate_api(request, language)
-        elif request['type'] == 'script':
-            code = self._generate_script(request, language)
-        elif request['type'] == 'component':
-            code = self._generate_component(request, language)
-        else:
-            code = self._generate_generic_code(request, language)
+        generator = self._generators.get(request['type'], self._generate_generic_code)
+        code = generator(request, language)
         
         # Save to file if specified
         if output_file:
@@ -98,10 +319,24 @@ class CoderAgent:
         
         # Check if it's a file path or code snippet
         if os.path.exists(code_or_file):
-            with open(code_or_file, 'r', encoding='utf-8') as f:
-                code = f.read()
             file_name = os.path.basename(code_or_file)
             language = self._detect_language_from_file(code_or_file)
+            
+            # Generic explanations only need a line count, so skip decoding the file
+            if language not in STRUCTURED_LANGUAGES:
+                line_count = self._count_file_lines(code_or_file)
+                return self._generate_explanation('', language, file_name, line_count)
+            
+            # Python structure is cached by file identity, so unchanged files are not re-read
+            if language == 'python':
+                stat = os.stat(code_or_file)
+                line_count, structure = _python_file_structure(
+                    os.path.abspath(code_or_file), stat.st_mtime_ns, stat.st_size
+                )
+                return self._generate_explanation('', language, file_name, line_count, structure)
+            
+            with open(code_or_file, 'r', encoding='utf-8') as f:
+                code = f.read()
         else:
             code = code_or_file
             file_name = "code snippet"
@@ -117,104 +352,77 @@ class CoderAgent:
             'type': 'function',  # default
             'name': '',
             'description': prompt,
+            'prompt_lower': prompt_lower,
             'features': [],
             'parameters': [],
             'return_type': None
         }
         
-        # Determine request type
-        if any(word in prompt_lower for word in ['class', 'object', 'struct']):
-            request['type'] = 'class'
-        elif any(word in prompt_lower for word in ['api', 'server', 'endpoint', 'rest']):
-            request['type'] = 'api'
-        elif any(word in prompt_lower for word in ['script', 'program', 'app']):
-            request['type'] = 'script'
-        elif any(word in prompt_lower for word in ['component', 'ui', 'interface']):
-            request['type'] = 'component'
-        
-        # Extract function/class name
-        name_patterns = [
-            r'(?:function|def|class)\s+(\w+)',
-            r'create\s+(?:a\s+)?(\w+)',
-            r'make\s+(?:a\s+)?(\w+)',
-            r'build\s+(?:a\s+)?(\w+)'
-        ]
+        # Scan the prompt once, collecting type, name and feature hits
+        tokens = prompt_lower.translate(WORD_SEPARATORS).split()
+        types = set()
+        features = set()
+        name_rank = len(NAME_VERB_PRIORITY)
         
-        for pattern in name_patterns:
-            match = re.search(pattern, prompt_lower)
-            if match:
-                request['name'] = match.group(1)
+        for i, token in enumerate(tokens):
+            request_type = REQUEST_TYPE_KEYWORDS.get(token)
+            if request_type:
+                types.add(request_type)
+            
+            feature = FEATURE_KEYWORDS.get(token)
+            if feature:
+                features.add(feature)
+            elif token == 'error' and i + 1 < len(tokens) and tokens[i + 1] == 'handling':
+                features.add('error_handling')
+            
+            # Name follows a verb ("create a parser" -> "parser"), first hit per verb wins
+            rank = NAME_VERB_PRIORITY.get(token, name_rank)
+            if rank < name_rank and i + 1 < len(tokens):
+                j = i + 1
+                if rank > 0 and tokens[j] == 'a' and j + 1 < len(tokens):
+                    j += 1
+                request['name'] = tokens[j]
+                name_rank = rank
+        
+        for request_type in REQUEST_TYPE_PRIORITY:
+            if request_type in types:
+                request['type'] = request_type
                 break
         
-        # Extract features
-        if 'validation' in prompt_lower:
-            request['features'].append('validation')
-        if 'error handling' in prompt_lower:
-            request['features'].append('error_handling')
-        if 'logging' in prompt_lower:
-            request['features'].append('logging')
-        if 'async' in prompt_lower or 'asynchronous' in prompt_lower:
-            request['features'].append('async')
+        request['features'] = [f for f in FEATURE_ORDER if f in features]
         
         return request
     
-    def _detect_language_from_prompt(self, prompt: str) -> str:
-        """Detect programming language from prompt"""
-        prompt_lower = prompt.lower()
-        
-        language_keywords = {
-            'python': ['python', 'django', 'flask', 'pandas', 'numpy'],
-            'javascript': ['javascript', 'js', 'node', 'express', 'npm'],
-            'typescript': ['typescript', 'ts'],
-            'react': ['react', 'jsx', 'component'],
-            'go': ['go', 'golang'],
-            'java': ['java', 'spring', 'maven'],
-            'cpp': ['c++', 'cpp'],
-            'rust': ['rust', 'cargo'],
-            'php': ['php', 'laravel'],
-            'ruby': ['ruby', 'rails']
-        }
-        
-        for lang, keywords in language_keywords.items():
-            if any(keyword in prompt_lower for keyword in keywords):
-                return lang
-        
-        return 'python'  # default
+    def _detect_language_from_prompt(self, prompt_lower: str) -> str:
+        """Detect programming language from an already-lowercased prompt"""
+        best_lang = None
+        best_rank = len(LANGUAGE_RANK)
+        
+        # One scan over the prompt instead of one substring search per keyword
+        for match in LANGUAGE_KEYWORD_RE.finditer(prompt_lower):
+            lang = KEYWORD_LANGUAGE[match.group(1)]
+            rank = LANGUAGE_RANK[lang]
+            if rank < best_rank:
+                best_lang, best_rank = lang, rank
+                if rank == 0:
+                    break
+        
+        return best_lang or 'python'  # default
     
     def _detect_language_from_file(self, file_path: str) -> str:
         """Detect language from file extension"""
-        ext = Path(file_path).suffix.lower()
-        
-        for lang, extensions in self.language_extensions.items():
-            if ext in extensions:
-                return lang
-        
-        return 'text'
+        ext = os.path.splitext(file_path)[1].lower()
+        return self._ext_to_lang.get(ext, 'text')
     
     def _detect_language_from_code(self, code: str) -> str:
         """Detect language from code content"""
-        if 'def ' in code or 'import ' in code:
-            return 'python'
-        elif 'function' in code or 'const' in code or 'let' in code:
-            return 'javascript'
-        elif 'func' in code and 'package' in code:
-            return 'go'
-        elif 'public class' in code or 'import java' in code:
-            return 'java'
-        else:
-            return 'text'
+        return _detect_language_from_sample(code[:LANGUAGE_SAMPLE_SIZE])
     
     def _generate_function(self, request: Dict, language: str) -> str:
         """Generate a function based on request"""
         
-        if language == 'python':
-            return self._generate_python_function(request)
-        elif language == 'javascript':
-            return self._generate_javascript_function(request)
-        elif language == 'go':
-            return self._generate_go_function(request)
-        else:
-            return self._generate_python_function(request)  # fallback
+        generator = self._function_generators.get(language, self._generate_python_function)  # python fallback
+        return generator(request)
     
     def _generate_python_function(self, request: Dict) -> str:
         """Generate Python function"""
@@ -222,72 +430,26 @@ class CoderAgent:
         description = request.get('description', 'Generated function')
         features = request.get('features', [])
         
-        # Build function signature
-        params = "data"  # default parameter
-        if 'validation' in features:
-            params = "data: Any"
-        
-        # Build function body
-        body_lines = [
-            f'    """',
-            f'    {description}',
-            f'    """'
-        ]
-        
-        if 'validation' in features:
-            body_lines.extend([
-                '',
-                '    if not data:',
-                '        raise ValueError("Data cannot be empty")'
-            ])
+        if not features:
+            return PY_PLAIN_FUNCTION_TEMPLATE.format(name=name, description=description)
         
-        if 'logging' in features:
-            body_lines.extend([
-                '',
-                '    import logging',
-                '    logging.info(f"Processing {name}")'
-            ])
-        
-        if 'error_handling' in features:
-            body_lines.extend([
-                '',
-                '    try:',
-                '        # Process the data',
-                '        result = process_data(data)',
-                '        return result',
-                '    except Exception as e:',
-                '        logging.error(f"Error in {name}: {e}")',
-                '        raise'
-            ])
-        else:
-            body_lines.extend([
-                '',
-                '    # TODO: Implement function logic',
-                '    result = None',
-                '',
-                '    return result'
-            ])
-        
-        # Combine everything
+        # Imports and signature
         imports = []
         if 'validation' in features:
             imports.append('from typing import Any')
         if 'logging' in features:
             imports.append('import logging')
         
-        function_code = []
-        if imports:
-            function_code.extend(imports)
-            function_code.append('')
-        
-        if 'async' in features:
-            function_code.append(f'async def {name}({params}):')
-        else:
-            function_code.append(f'def {name}({params}):')
-        
-        function_code.extend(body_lines)
-        
-        return '\\n'.join(function_code)
+        return PY_FUNCTION_TEMPLATE.format_map({
+            'imports': '\n'.join(imports) + '\n\n' if imports else '',
+            'async_kw': 'async ' if 'async' in features else '',
+            'name': name,
+            'params': 'data: Any' if 'validation' in features else 'data',
+            'description': description,
+            'validation': PY_VALIDATION_BLOCK if 'validation' in features else '',
+            'logging': PY_LOGGING_BLOCK if 'logging' in features else '',
+            'body': PY_ERROR_HANDLING_BODY if 'error_handling' in features else PY_TODO_BODY,
+        })
     
     def _generate_javascript_function(self, request: Dict) -> str:
         """Generate JavaScript function"""
@@ -295,43 +457,13 @@ class CoderAgent:
         description = request.get('description', 'Generated function')
         features = request.get('features', [])
         
-        # Build function
-        if 'async' in features:
-            func_def = f'async function {name}(data) {{'
-        else:
-            func_def = f'function {name}(data) {{'
-        
-        body_lines = [
-            f'  /**',
-            f'   * {description}',
-            f'   */',
-        ]
-        
-        if 'validation' in features:
-            body_lines.extend([
-                '',
-                '  if (!data) {',
-                '    throw new Error("Data cannot be empty");',
-                '  }'
-            ])
-        
-        if 'logging' in features:
-            body_lines.extend([
-                '',
-                f'  console.log("Processing {name}");'
-            ])
-        
-        body_lines.extend([
-            '',
-            '  // TODO: Implement function logic',
-            '  const result = null;',
-            '',
-            '  return result;'
-        ])
-        
-        function_code = [func_def] + body_lines + ['}']
-        
-        return '\\n'.join(function_code)
+        return JS_FUNCTION_TEMPLATE.format_map({
+            'async_kw': 'async ' if 'async' in features else '',
+            'name': name,
+            'description': description,
+            'validation': JS_VALIDATION_BLOCK if 'validation' in features else '',
+            'logging': JS_LOGGING_BLOCK.format(name=name) if 'logging' in features else '',
+        })
     
     def _generate_go_function(self, request: Dict) -> str:
         """Generate Go function"""
@@ -342,71 +474,26 @@ class CoderAgent:
         if name and name[0].islower():
             name = name[0].upper() + name[1:]
         
-        function_code = [
-            '// ' + description,
-            f'func {name}(data interface{{}}) (interface{{}}, error) {{',
-            '    // TODO: Implement function logic',
-            '    return nil, nil',
-            '}'
-        ]
-        
-        return '\\n'.join(function_code)
+        return GO_FUNCTION_TEMPLATE.format_map({'name': name, 'description': description})
     
     def _generate_class(self, request: Dict, language: str) -> str:
         """Generate a class"""
-        if language == 'python':
-            return self._generate_python_class(request)
-        elif language == 'javascript':
-            return self._generate_javascript_class(request)
-        else:
-            return self._generate_python_class(request)
+        generator = self._class_generators.get(language, self._generate_python_class)
+        return generator(request)
     
     def _generate_python_class(self, request: Dict) -> str:
         """Generate Python class"""
         name = request.get('name', 'GeneratedClass')
         description = request.get('description', 'Generated class')
         
-        class_code = [
-            f'class {name}:',
-            f'    """',
-            f'    {description}',
-            f'    """',
-            '',
-            '    def __init__(self):',
-            '        """Initialize the class"""',
-            '        pass',
-            '',
-            '    def process(self, data):',
-            '        """Process data"""',
-            '        # TODO: Implement processing logic',
-            '        return data'
-        ]
-        
-        return '\\n'.join(class_code)
+        return PY_CLASS_TEMPLATE.format_map({'name': name, 'description': description})
     
     def _generate_javascript_class(self, request: Dict) -> str:
         """Generate JavaScript class"""
         name = request.get('name', 'GeneratedClass')
         description = request.get('description', 'Generated class')
         
-        class_code = [
-            f'/**',
-            f' * {description}',
-            f' */',
-            f'class {name} {{',
-            '',
-            '  constructor() {',
-            '    // Initialize the class',
-            '  }',
-            '',
-            '  process(data) {',
-            '    // TODO: Implement processing logic',
-            '    return data;',
-            '  }',
-            '}'
-        ]
-        
-        return '\\n'.join(class_code)
+        return JS_CLASS_TEMPLATE.format_map({'name': name, 'description': description})
     
     def _generate_generic_code(self, request: Dict, language: str) -> str:
         """Generate generic code when specific type is unknown"""
@@ -428,22 +515,18 @@ class CoderAgent:
     def _improve_code(self, code: str, language: str) -> str:
         """Improve existing code"""
         # This is a simplified version - real implementation would be much more complex
-        lines = code.splitlines()
-        improved_lines = []
         
-        for line in lines:
-            # Remove trailing whitespace
-            line = line.rstrip()
-            
-            # Basic improvements for Python
-            if language == 'python':
-                # Replace print with logging where appropriate
+        # Remove trailing whitespace
+        improved_lines = [line.rstrip() for line in code.splitlines()]
+        
+        # Basic improvements for Python; one buffer-wide search gates the per-line pass
+        if language == 'python' and 'print(' in code:
+            for i, line in enumerate(improved_lines):
+                # Replace print with logging where appropriate; lowercase only on a hit
                 if 'print(' in line and 'debug' in line.lower():
-                    line = line.replace('print(', 'logging.debug(')
-            
-            improved_lines.append(line)
+                    improved_lines[i] = line.replace('print(', 'logging.debug(')
         
-        return '\\n'.join(improved_lines)
+        return '\n'.join(improved_lines)
     
     def _optimize_code(self, code: str, language: str) -> str:
         """Optimize code for performance"""
@@ -453,36 +536,54 @@ class CoderAgent:
         """Modernize code to use current best practices"""
         return self._improve_code(code, language)  # Placeholder
     
-    def _generate_explanation(self, code: str, language: str, file_name: str) -> str:
+    def _count_file_lines(self, file_path: str) -> int:
+        """Count lines by streaming raw bytes, without decoding the file"""
+        count = 0
+        last = b'\n'
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), b''):
+                count += chunk.count(b'\n')
+                last = chunk[-1:]
+        
+        # A final line without a trailing newline still counts
+        return count if last == b'\n' else count + 1
+    
+    def _generate_explanation(self, code: str, language: str, file_name: str,
+                              line_count: Optional[int] = None,
+                              structure: Optional[Mapping[str, Tuple[str, ...]]] = None) -> str:
         """Generate explanation of what the code does"""
-        lines = code.splitlines()
+        if line_count is None:
+            line_count = len(code.splitlines())
         
         explanation = [
             f"📄 **Code Explanation: {file_name}**",
             "=" * 50,
             f"**Language:** {language.capitalize()}",
-            f"**Lines of code:** {len(lines)}",
+            f"**Lines of code:** {line_count}",
             "",
             "## 🎯 **Purpose**"
         ]
         
         # Analyze code structure
         if language == 'python':
-            explanation.extend(self._explain_python_code(code))
+            explanation.extend(self._explain_python_code(code, structure))
         elif language == 'javascript':
             explanation.extend(self._explain_javascript_code(code))
         else:
             explanation.extend(self._explain_generic_code(code))
         
-        return '\\n'.join(explanation)
+        return '\n'.join(explanation)
     
-    def _explain_python_code(self, code: str) -> List[str]:
+    def _explain_python_code(self, code: str,
+                             structure: Optional[Mapping[str, Tuple[str, ...]]] = None) -> List[str]:
         """Explain Python code"""
         explanation = []
         
-        # Look for imports
-        imports = re.findall(r'^import\s+(\w+)', code, re.MULTILINE)
-        from_imports = re.findall(r'^from\s+(\w+)\s+import', code, re.MULTILINE)
+        found = structure if structure is not None else _python_structure(code)
+        imports = found['imports']
+        from_imports = found['from_imports']
+        functions = found['functions']
+        classes = found['classes']
         
         if imports or from_imports:
             explanation.append("**Dependencies:**")
@@ -492,10 +593,6 @@ class CoderAgent:
                 explanation.append(f"- `{imp}` - Specific imports")
             explanation.append("")
         
-        # Look for functions and classes
-        functions = re.findall(r'^def\s+(\w+)', code, re.MULTILINE)
-        classes = re.findall(r'^class\s+(\w+)', code, re.MULTILINE)
-        
         if classes:
             explanation.append("**Classes:**")
             for cls in classes:
@@ -516,9 +613,12 @@ class CoderAgent:
         """Explain JavaScript code"""
         explanation = []
         
-        # Look for functions
-        functions = re.findall(r'function\s+(\w+)', code)
-        arrow_functions = re.findall(r'const\s+(\w+)\s*=\s*\(', code)
+        # Look for function declarations and arrow functions in one scan
+        found = {'functions': [], 'arrow_functions': []}
+        for match in JS_STRUCTURE_RE.finditer(code):
+            found[match.lastgroup].append(match.group(match.lastgroup))
+        functions = found['functions']
+        arrow_functions = found['arrow_functions']
         
         if functions or arrow_functions:
             explanation.append("**Functions:**")
@@ -541,23 +641,20 @@ class CoderAgent:
     
     def _save_code_to_file(self, code: str, file_path: str):
         """Save generated code to file"""
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(code)
-    
-    def _get_python_templates(self) -> Dict:
-        """Get Python code templates"""
-        return {}  # Could be expanded
-    
-    def _get_javascript_templates(self) -> Dict:
-        """Get JavaScript code templates"""
-        return {}  # Could be expanded
-    
-    def _get_go_templates(self) -> Dict:
-        """Get Go code templates"""
-        return {}  # Could be expanded
-    
-    def _get_react_templates(self) -> Dict:
-        """Get React code templates"""
-        return {}  # Could be expanded
\ No newline at end of file
+        data = code.encode('utf-8')
+        
+        # Bare filenames have no directory to create
+        dir_name = os.path.dirname(file_path)
+        if dir_name:
+            os.makedirs(dir_name, exist_ok=True)
+        
+        # Write to a sibling temp file and swap it in, so readers never see a partial file
+        tmp_path = file_path + '.tmp'
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, file_path)
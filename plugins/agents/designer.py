@@ -5,247 +5,138 @@ DesignerAgent - AI-powered UI code generation
 import re
 import os
 import json
-from typing import Dict, List, Optional
+import string
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from pathlib import Path
+from types import MappingProxyType
 
-class DesignerAgent:
-    """AI-powered design agent that generates UI code from natural language"""
-    
-    def __init__(self):
-        self.output_dir = Path("snapmethod/exports")
-        self.component_templates = {
-            'react': self._get_react_templates(),
-            'vue': self._get_vue_templates(),
-            'angular': self._get_angular_templates()
-        }
-        self.css_frameworks = {
-            'tailwind': self._get_tailwind_classes(),
-            'bootstrap': self._get_bootstrap_classes(),
-            'material': self._get_material_classes()
-        }
-        
-    def generate(self, prompt: str) -> str:
-        """Generate UI code from natural language prompt"""
-        
-        # Parse the prompt to extract design requirements
-        requirements = self._parse_prompt(prompt)
-        
-        # Determine the best framework and styling approach
-        framework = self._determine_framework(requirements)
-        styling = self._determine_styling(requirements)
-        
-        # Generate the code
-        code = self._generate_component(requirements, framework, styling)
-        
-        # Save to file
-        file_path = self._save_code(code, requirements['component_name'], framework)
-        
-        return code
-    
-    def _parse_prompt(self, prompt: str) -> Dict:
-        """Parse the design prompt to extract requirements"""
-        prompt_lower = prompt.lower()
-        
-        requirements = {
-            'component_name': self._extract_component_name(prompt),
-            'component_type': self._extract_component_type(prompt_lower),
-            'colors': self._extract_colors(prompt_lower),
-            'layout': self._extract_layout(prompt_lower),
-            'features': self._extract_features(prompt_lower),
-            'styling': self._extract_styling_preferences(prompt_lower)
-        }
-        
-        return requirements
-    
-    def _extract_component_name(self, prompt: str) -> str:
-        """Extract component name from prompt"""
-        # Look for explicit component names
-        name_patterns = [
-            r'(\w+)\s+(?:page|component|form|modal|card)',
-            r'(?:create|build|make)\s+a?\s*(\w+)',
-            r'(\w+)\s+(?:interface|ui|screen)'
-        ]
-        
-        for pattern in name_patterns:
-            match = re.search(pattern, prompt.lower())
-            if match:
-                name = match.group(1).capitalize()
-                if name not in ['a', 'the', 'an', 'with', 'for']:
-                    return f"{name}Component"
-        
-        # Default fallback
-        if 'login' in prompt.lower():
-            return "LoginComponent"
-        elif 'form' in prompt.lower():
-            return "FormComponent"
-        elif 'card' in prompt.lower():
-            return "CardComponent"
-        elif 'modal' in prompt.lower():
-            return "ModalComponent"
-        elif 'nav' in prompt.lower():
-            return "NavigationComponent"
-        else:
-            return "CustomComponent"
-    
-    def _extract_component_type(self, prompt: str) -> str:
-        """Determine the type of component to generate"""
-        if any(word in prompt for word in ['login', 'signin', 'auth']):
-            return 'login_form'
-        elif any(word in prompt for word in ['signup', 'register']):
-            return 'signup_form'
-        elif 'form' in prompt:
-            return 'form'
-        elif any(word in prompt for word in ['card', 'profile']):
-            return 'card'
-        elif any(word in prompt for word in ['nav', 'navigation', 'menu']):
-            return 'navigation'
-        elif any(word in prompt for word in ['modal', 'dialog', 'popup']):
-            return 'modal'
-        elif any(word in prompt for word in ['button', 'btn']):
-            return 'button'
-        elif any(word in prompt for word in ['table', 'list']):
-            return 'table'
-        else:
-            return 'generic'
-    
-    def _extract_colors(self, prompt: str) -> Dict[str, str]:
-        """Extract color preferences from prompt"""
-        colors = {
-            'primary': '#3b82f6',  # blue
-            'secondary': '#64748b', # gray
-            'accent': '#10b981',   # green
-            'background': '#ffffff',
-            'text': '#1f2937'
-        }
-        
-        # Dark theme detection
-        if any(word in prompt for word in ['dark', 'black', 'night']):
-            colors.update({
-                'background': '#1f2937',
-                'text': '#f9fafb',
-                'secondary': '#374151'
-            })
-        
-        # Color-specific detection
-        color_map = {
-            'blue': '#3b82f6',
-            'red': '#ef4444',
-            'green': '#10b981', 
-            'purple': '#8b5cf6',
-            'yellow': '#f59e0b',
-            'pink': '#ec4899',
-            'indigo': '#6366f1',
-            'orange': '#f97316'
-        }
-        
-        for color_name, hex_value in color_map.items():
-            if color_name in prompt:
-                colors['primary'] = hex_value
-        
-        # Neon/glow effect detection
-        if any(word in prompt for word in ['neon', 'glow', 'bright']):
-            colors['accent'] = '#00ffff'  # cyan glow
-            
-        return colors
-    
-    def _extract_layout(self, prompt: str) -> str:
-        """Determine layout type"""
-        if any(word in prompt for word in ['center', 'centered']):
-            return 'centered'
-        elif any(word in prompt for word in ['sidebar', 'side']):
-            return 'sidebar'
-        elif any(word in prompt for word in ['grid', 'columns']):
-            return 'grid'
-        elif any(word in prompt for word in ['flex', 'horizontal']):
-            return 'flex'
-        else:
-            return 'default'
-    
-    def _extract_features(self, prompt: str) -> List[str]:
-        """Extract specific features mentioned in prompt"""
-        features = []
-        
-        feature_keywords = {
-            'validation': ['validation', 'validate', 'error'],
-            'animation': ['animation', 'animate', 'transition'],
-            'responsive': ['responsive', 'mobile', 'tablet'],
-            'icons': ['icon', 'icons'],
-            'images': ['image', 'photo', 'picture'],
-            'search': ['search', 'filter'],
-            'dropdown': ['dropdown', 'select'],
-            'tabs': ['tab', 'tabs'],
-            'tooltip': ['tooltip', 'hover'],
-            'loading': ['loading', 'spinner', 'loader']
-        }
-        
-        for feature, keywords in feature_keywords.items():
-            if any(keyword in prompt for keyword in keywords):
-                features.append(feature)
-        
-        return features
-    
-    def _extract_styling_preferences(self, prompt: str) -> Dict:
-        """Extract styling preferences"""
-        styling = {
-            'framework': 'tailwind',  # default
-            'rounded': 'rounded' in prompt or 'curved' in prompt,
-            'shadow': 'shadow' in prompt,
-            'border': 'border' in prompt or 'outlined' in prompt,
-            'gradient': 'gradient' in prompt
-        }
-        
-        if 'bootstrap' in prompt:
-            styling['framework'] = 'bootstrap'
-        elif 'material' in prompt:
-            styling['framework'] = 'material'
-        
-        return styling
-    
-    def _determine_framework(self, requirements: Dict) -> str:
-        """Determine the best framework for the component"""
-        # Default to React with TypeScript
-        return 'react'
-    
-    def _determine_styling(self, requirements: Dict) -> str:
-        """Determine styling approach"""
-        return requirements['styling']['framework']
-    
-    def _generate_component(self, requirements: Dict, framework: str, styling: str) -> str:
-        """Generate the actual component code"""
-        
-        if requirements['component_type'] == 'login_form':
-            return self._generate_login_form(requirements, framework, styling)
-        elif requirements['component_type'] == 'signup_form':
-            return self._generate_signup_form(requirements, framework, styling)
-        elif requirements['component_type'] == 'card':
-            return self._generate_card(requirements, framework, styling)
-        elif requirements['component_type'] == 'navigation':
-            return self._generate_navigation(requirements, framework, styling)
-        elif requirements['component_type'] == 'modal':
-            return self._generate_modal(requirements, framework, styling)
-        elif requirements['component_type'] == 'button':
-            return self._generate_button(requirements, framework, styling)
-        else:
-            return self._generate_generic_component(requirements, framework, styling)
-    
-    def _generate_login_form(self, requirements: Dict, framework: str, styling: str) -> str:
-        """Generate a login form component"""
-        colors = requirements['colors']
-        is_dark = colors['background'] == '#1f2937'
-        has_glow = colors['accent'] == '#00ffff'
-        
-        glow_classes = 'shadow-lg shadow-cyan-500/50' if has_glow else ''
-        bg_class = 'bg-gray-900' if is_dark else 'bg-white'
-        text_class = 'text-white' if is_dark else 'text-gray-900'
-        
-        return f'''import React, {{ useState }} from 'react';
+from .keywords import KeywordScanner
+
+# Apostrophes are dropped ("user's" -> "users"); other punctuation becomes a word break
+PROMPT_NORMALIZE = str.maketrans({
+    char: None if char == "'" else ' '
+    for char in string.punctuation
+    if char != '_'
+})
+
+# Component name patterns, compiled once at import time
+NAME_PATTERNS = (
+    re.compile(r'(\w+)\s+(?:page|component|form|modal|card)'),
+    re.compile(r'(?:create|build|make)\s+a?\s*(\w+)'),
+    re.compile(r'(\w+)\s+(?:interface|ui|screen)'),
+)
+NAME_STOPWORDS = frozenset({'a', 'the', 'an', 'with', 'for'})
+
+# Prompt keyword tables; ordered tables resolve to their first matching entry
+COMPONENT_TYPE_KEYWORDS = (
+    ('login_form', frozenset({'login', 'signin', 'auth'})),
+    ('signup_form', frozenset({'signup', 'register'})),
+    ('form', frozenset({'form'})),
+    ('card', frozenset({'card', 'profile'})),
+    ('navigation', frozenset({'nav', 'navigation', 'menu'})),
+    ('modal', frozenset({'modal', 'dialog', 'popup'})),
+    ('button', frozenset({'button', 'btn'})),
+    ('table', frozenset({'table', 'list'})),
+)
+THEME_KEYWORDS = (
+    ('dark', frozenset({'dark', 'black', 'night'})),
+    ('glow', frozenset({'neon', 'glow', 'bright'})),
+)
+COLOR_MAP = {
+    'blue': '#3b82f6',
+    'red': '#ef4444',
+    'green': '#10b981',
+    'purple': '#8b5cf6',
+    'yellow': '#f59e0b',
+    'pink': '#ec4899',
+    'indigo': '#6366f1',
+    'orange': '#f97316'
+}
+# The first color word in the prompt sets the primary color
+COLOR_RE = re.compile(r'\b(' + '|'.join(COLOR_MAP) + r')\b')
+LAYOUT_KEYWORDS = (
+    ('centered', frozenset({'center', 'centered'})),
+    ('sidebar', frozenset({'sidebar', 'side'})),
+    ('grid', frozenset({'grid', 'columns'})),
+    ('flex', frozenset({'flex', 'horizontal'})),
+)
+FEATURE_KEYWORDS = (
+    ('validation', frozenset({'validation', 'validate', 'error'})),
+    ('animation', frozenset({'animation', 'animate', 'transition'})),
+    ('responsive', frozenset({'responsive', 'mobile', 'tablet'})),
+    ('icons', frozenset({'icon', 'icons'})),
+    ('images', frozenset({'image', 'photo', 'picture'})),
+    ('search', frozenset({'search', 'filter'})),
+    ('dropdown', frozenset({'dropdown', 'select'})),
+    ('tabs', frozenset({'tab', 'tabs'})),
+    ('tooltip', frozenset({'tooltip', 'hover'})),
+    ('loading', frozenset({'loading', 'spinner', 'loader'})),
+)
+STYLING_KEYWORDS = (
+    ('rounded', frozenset({'rounded', 'curved'})),
+    ('shadow', frozenset({'shadow'})),
+    ('border', frozenset({'border', 'outlined'})),
+    ('gradient', frozenset({'gradient'})),
+)
+CSS_FRAMEWORK_KEYWORDS = (
+    ('bootstrap', frozenset({'bootstrap'})),
+    ('material', frozenset({'material'})),
+)
+# Component names used when no explicit name is given
+NAME_FALLBACKS = (
+    ('LoginComponent', frozenset({'login'})),
+    ('FormComponent', frozenset({'form'})),
+    ('CardComponent', frozenset({'card'})),
+    ('ModalComponent', frozenset({'modal'})),
+    ('NavigationComponent', frozenset({'nav'})),
+)
+
+# Every table above, by the category its matches are tagged with
+KEYWORD_TABLES = {
+    'component_type': COMPONENT_TYPE_KEYWORDS,
+    'theme': THEME_KEYWORDS,
+    'layout': LAYOUT_KEYWORDS,
+    'feature': FEATURE_KEYWORDS,
+    'styling': STYLING_KEYWORDS,
+    'css_framework': CSS_FRAMEWORK_KEYWORDS,
+    'name': NAME_FALLBACKS,
+}
+
+def _keyword_tags() -> Dict[str, Set[Tuple[str, str]]]:
+    """Map each keyword to the (category, value) tags it triggers"""
+    tags: Dict[str, Set[Tuple[str, str]]] = {}
+    for category, table in KEYWORD_TABLES.items():
+        for value, keywords in table:
+            for keyword in keywords:
+                tags.setdefault(keyword, set()).add((category, value))
+    return tags
+
+# One scan of the prompt yields the tags for every extractor at once
+KEYWORD_SCANNER = KeywordScanner(_keyword_tags())
+
+def _first_tagged(tags: Set[Tuple[str, str]], category: str, default: str) -> str:
+    """Return the first value of a category's table that was tagged, else default"""
+    for value, _ in KEYWORD_TABLES[category]:
+        if (category, value) in tags:
+            return value
+    return default
+
+# Rendered prompts kept per agent instance
+RENDER_CACHE_SIZE = 256
+
+# Upper bound on threads used by save_many
+SAVE_WORKERS = 8
+
+# Component templates; only the names and theme classes are filled in per call
+LOGIN_FORM_TEMPLATE = '''import React, {{ useState }} from 'react';
 
 interface LoginFormProps {{
   onLogin?: (email: string, password: string) => void;
   className?: string;
 }}
 
-const {requirements['component_name']}: React.FC<LoginFormProps> = ({{ onLogin, className = '' }}) => {{
+const {component_name}: React.FC<LoginFormProps> = ({{ onLogin, className = '' }}) => {{
   const [email, setEmail] = useState('');
   const [password, setPassword] = useState('');
   const [isLoading, setIsLoading] = useState(false);
@@ -279,7 +170,7 @@ const {requirements['component_name']}: React.FC<LoginFormProps> = ({{ onLogin,
   }};
 
   return (
-    <div className={{`min-h-screen flex items-center justify-center {bg_class.replace('bg-', 'bg-gradient-to-br from-')} py-12 px-4 sm:px-6 lg:px-8 ${{className}}`}}>
+    <div className={{`min-h-screen flex items-center justify-center {gradient_class} py-12 px-4 sm:px-6 lg:px-8 ${{className}}`}}>
       <div className="max-w-md w-full space-y-8">
         <div className="text-center">
           <h2 className="mt-6 text-3xl font-extrabold {text_class}">
@@ -368,15 +259,10 @@ const {requirements['component_name']}: React.FC<LoginFormProps> = ({{ onLogin,
   );
 }};
 
-export default {requirements['component_name']};
+export default {component_name};
 '''
 
-    def _generate_card(self, requirements: Dict, framework: str, styling: str) -> str:
-        """Generate a card component"""
-        colors = requirements['colors']
-        is_dark = colors['background'] == '#1f2937'
-        
-        return f'''import React from 'react';
+CARD_TEMPLATE = '''import React from 'react';
 
 interface CardProps {{
   title?: string;
@@ -387,7 +273,7 @@ interface CardProps {{
   className?: string;
 }}
 
-const {requirements['component_name']}: React.FC<CardProps> = ({{
+const {component_name}: React.FC<CardProps> = ({{
   title,
   subtitle,
   content,
@@ -396,7 +282,7 @@ const {requirements['component_name']}: React.FC<CardProps> = ({{
   className = ''
 }}) => {{
   return (
-    <div className={{`{'bg-gray-800' if is_dark else 'bg-white'} rounded-lg shadow-md overflow-hidden ${{className}}`}}>
+    <div className={{`{card_class} rounded-lg shadow-md overflow-hidden ${{className}}`}}>
       {{image && (
         <img 
           src={{image}} 
@@ -406,17 +292,17 @@ const {requirements['component_name']}: React.FC<CardProps> = ({{
       )}}
       <div className="p-6">
         {{title && (
-          <h3 className="text-lg font-semibold {'text-white' if is_dark else 'text-gray-900'} mb-2">
+          <h3 className="text-lg font-semibold {title_class} mb-2">
             {{title}}
           </h3>
         )}}
         {{subtitle && (
-          <p className="text-sm {'text-gray-400' if is_dark else 'text-gray-600'} mb-4">
+          <p className="text-sm {subtitle_class} mb-4">
             {{subtitle}}
           </p>
         )}}
         {{content && (
-          <div className="{'text-gray-300' if is_dark else 'text-gray-700'} mb-4">
+          <div className="{content_class} mb-4">
             {{content}}
           </div>
         )}}
@@ -430,23 +316,21 @@ const {requirements['component_name']}: React.FC<CardProps> = ({{
   );
 }};
 
-export default {requirements['component_name']};
+export default {component_name};
 '''
 
-    def _generate_generic_component(self, requirements: Dict, framework: str, styling: str) -> str:
-        """Generate a generic component"""
-        return f'''import React from 'react';
+GENERIC_COMPONENT_TEMPLATE = '''import React from 'react';
 
-interface {requirements['component_name']}Props {{
+interface {component_name}Props {{
   className?: string;
   children?: React.ReactNode;
 }}
 
-const {requirements['component_name']}: React.FC<{requirements['component_name']}Props> = ({{ className = '', children }}) => {{
+const {component_name}: React.FC<{component_name}Props> = ({{ className = '', children }}) => {{
   return (
     <div className={{`p-4 rounded-lg shadow-md bg-white ${{className}}`}}>
       <h2 className="text-xl font-bold mb-4">
-        {requirements['component_name'].replace('Component', '')}
+        {title}
       </h2>
       <div>
         {{children || <p>Custom component content goes here.</p>}}
@@ -455,13 +339,247 @@ const {requirements['component_name']}: React.FC<{requirements['component_name']
   );
 }};
 
-export default {requirements['component_name']};
+export default {component_name};
 '''
 
+# Theme classes keyed by whether the dark palette is active
+LOGIN_THEME_CLASSES = {
+    True: {'bg_class': 'bg-gray-900', 'text_class': 'text-white', 'gradient_class': 'bg-gradient-to-br from-gray-900'},
+    False: {'bg_class': 'bg-white', 'text_class': 'text-gray-900', 'gradient_class': 'bg-gradient-to-br from-white'},
+}
+CARD_THEME_CLASSES = {
+    True: {'card_class': 'bg-gray-800', 'title_class': 'text-white', 'subtitle_class': 'text-gray-400', 'content_class': 'text-gray-300'},
+    False: {'card_class': 'bg-white', 'title_class': 'text-gray-900', 'subtitle_class': 'text-gray-600', 'content_class': 'text-gray-700'},
+}
+
+def _template_parts(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Split a format template into (literal, field name) pairs, unescaping braces once"""
+    return tuple((literal, field) for literal, field, _, _ in string.Formatter().parse(template))
+
+def _fill_template(parts: Tuple[Tuple[str, Optional[str]], ...], values: Dict[str, str]) -> str:
+    """Render pre-split template parts with a single join"""
+    out = []
+    for literal, field in parts:
+        out.append(literal)
+        if field is not None:
+            out.append(values[field])
+    return ''.join(out)
+
+# Templates pre-split at import, so rendering skips format-string parsing
+LOGIN_FORM_PARTS = _template_parts(LOGIN_FORM_TEMPLATE)
+CARD_PARTS = _template_parts(CARD_TEMPLATE)
+GENERIC_COMPONENT_PARTS = _template_parts(GENERIC_COMPONENT_TEMPLATE)
+
+# Framework template and CSS class tables, shared read-only by all agents
+COMPONENT_TEMPLATES = MappingProxyType({
+    'react': {},    # Implemented above in generate methods
+    'vue': {},      # Could be implemented for Vue support
+    'angular': {}   # Could be implemented for Angular support
+})
+CSS_FRAMEWORKS = MappingProxyType({
+    'tailwind': {
+        'colors': {
+            'primary': 'bg-blue-500',
+            'secondary': 'bg-gray-500',
+            'success': 'bg-green-500',
+            'danger': 'bg-red-500',
+            'warning': 'bg-yellow-500',
+            'info': 'bg-blue-400'
+        },
+        'spacing': {
+            'xs': 'p-2',
+            'sm': 'p-4',
+            'md': 'p-6',
+            'lg': 'p-8',
+            'xl': 'p-10'
+        }
+    },
+    'bootstrap': {},  # Could be implemented
+    'material': {}    # Could be implemented
+})
+
+class DesignerAgent:
+    """AI-powered design agent that generates UI code from natural language"""
+    
+    __slots__ = ('output_dir', '_ready_dir', '_generators', '_render')
+    
+    # Shared by every instance; built once at import
+    component_templates = COMPONENT_TEMPLATES
+    css_frameworks = CSS_FRAMEWORKS
+    
+    def __init__(self):
+        self.output_dir = Path("snapmethod/exports")
+        self._ready_dir = None
+        # Component types without a dedicated generator use the generic one
+        self._generators = {
+            'login_form': self._generate_login_form,
+            'card': self._generate_card,
+        }
+        self._render = lru_cache(maxsize=RENDER_CACHE_SIZE)(self._render_prompt)
+        
+    def generate(self, prompt: str) -> str:
+        """Generate UI code from natural language prompt"""
+        
+        component_name, framework, code = self.render(prompt)
+        
+        # Save to file
+        file_path = self._save_code(code, component_name, framework)
+        
+        return code
+    
+    def render(self, prompt: str) -> Tuple[str, str, str]:
+        """Generate UI code without saving it, as (component name, framework, code)"""
+        # Identical prompts produce identical code, so reuse earlier renders
+        return self._render(prompt)
+    
+    def _render_prompt(self, prompt: str) -> Tuple[str, str, str]:
+        """Render a prompt into (component name, framework, code)"""
+        
+        # Parse the prompt to extract design requirements
+        requirements = self._parse_prompt(prompt)
+        
+        # Determine the best framework and styling approach
+        framework = self._determine_framework(requirements)
+        styling = self._determine_styling(requirements)
+        
+        # Generate the code
+        code = self._generate_component(requirements, framework, styling)
+        
+        return requirements['component_name'], framework, code
+    
+    def _parse_prompt(self, prompt: str) -> Dict:
+        """Parse the design prompt to extract requirements"""
+        # Fold case and punctuation once for every extractor
+        prompt_norm = prompt.translate(PROMPT_NORMALIZE).lower()
+        
+        # A single pass over the prompt tags it for all extractors
+        tags = KEYWORD_SCANNER.scan(prompt_norm)
+        
+        requirements = {
+            'component_name': self._extract_component_name(prompt_norm, tags),
+            'component_type': self._extract_component_type(tags),
+            'colors': self._extract_colors(prompt_norm, tags),
+            'layout': self._extract_layout(tags),
+            'features': self._extract_features(tags),
+            'styling': self._extract_styling_preferences(tags)
+        }
+        
+        return requirements
+    
+    def _extract_component_name(self, prompt_norm: str, tags: Set[Tuple[str, str]]) -> str:
+        """Extract component name from prompt"""
+        # Look for explicit component names
+        for pattern in NAME_PATTERNS:
+            match = pattern.search(prompt_norm)
+            if match:
+                word = match.group(1)
+                # prompt_norm is already lowercase, so only the first letter changes
+                if word not in NAME_STOPWORDS:
+                    return f"{word[:1].upper()}{word[1:]}Component"
+        
+        # Default fallback
+        return _first_tagged(tags, 'name', "CustomComponent")
+    
+    def _extract_component_type(self, tags: Set[Tuple[str, str]]) -> str:
+        """Determine the type of component to generate"""
+        return _first_tagged(tags, 'component_type', 'generic')
+    
+    def _extract_colors(self, prompt_norm: str, tags: Set[Tuple[str, str]]) -> Dict[str, str]:
+        """Extract color preferences from prompt"""
+        colors = {
+            'primary': '#3b82f6',  # blue
+            'secondary': '#64748b', # gray
+            'accent': '#10b981',   # green
+            'background': '#ffffff',
+            'text': '#1f2937'
+        }
+        
+        # Dark theme detection
+        if ('theme', 'dark') in tags:
+            colors.update({
+                'background': '#1f2937',
+                'text': '#f9fafb',
+                'secondary': '#374151'
+            })
+        
+        # Color-specific detection
+        match = COLOR_RE.search(prompt_norm)
+        if match:
+            colors['primary'] = COLOR_MAP[match.group(1)]
+        
+        # Neon/glow effect detection
+        if ('theme', 'glow') in tags:
+            colors['accent'] = '#00ffff'  # cyan glow
+            
+        return colors
+    
+    def _extract_layout(self, tags: Set[Tuple[str, str]]) -> str:
+        """Determine layout type"""
+        return _first_tagged(tags, 'layout', 'default')
+    
+    def _extract_features(self, tags: Set[Tuple[str, str]]) -> List[str]:
+        """Extract specific features mentioned in prompt"""
+        return [
+            feature
+            for feature, _ in FEATURE_KEYWORDS
+            if ('feature', feature) in tags
+        ]
+    
+    def _extract_styling_preferences(self, tags: Set[Tuple[str, str]]) -> Dict:
+        """Extract styling preferences"""
+        styling = {'framework': _first_tagged(tags, 'css_framework', 'tailwind')}
+        for style, _ in STYLING_KEYWORDS:
+            styling[style] = ('styling', style) in tags
+        
+        return styling
+    
+    def _determine_framework(self, requirements: Dict) -> str:
+        """Determine the best framework for the component"""
+        # Default to React with TypeScript
+        return 'react'
+    
+    def _determine_styling(self, requirements: Dict) -> str:
+        """Determine styling approach"""
+        return requirements['styling']['framework']
+    
+    def _generate_component(self, requirements: Dict, framework: str, styling: str) -> str:
+        """Generate the actual component code"""
+        
+        generator = self._generators.get(requirements['component_type'], self._generate_generic_component)
+        return generator(requirements, framework, styling)
+    
+    def _generate_login_form(self, requirements: Dict, framework: str, styling: str) -> str:
+        """Generate a login form component"""
+        is_dark = requirements['colors']['background'] == '#1f2937'
+        
+        return _fill_template(LOGIN_FORM_PARTS, {
+            'component_name': requirements['component_name'],
+            **LOGIN_THEME_CLASSES[is_dark],
+        })
+
+    def _generate_card(self, requirements: Dict, framework: str, styling: str) -> str:
+        """Generate a card component"""
+        is_dark = requirements['colors']['background'] == '#1f2937'
+        
+        return _fill_template(CARD_PARTS, {
+            'component_name': requirements['component_name'],
+            **CARD_THEME_CLASSES[is_dark],
+        })
+
+    def _generate_generic_component(self, requirements: Dict, framework: str, styling: str) -> str:
+        """Generate a generic component"""
+        name = requirements['component_name']
+        return _fill_template(GENERIC_COMPONENT_PARTS, {
+            'component_name': name,
+            'title': name.replace('Component', ''),
+        })
+
     def _save_code(self, code: str, component_name: str, framework: str) -> str:
         """Save generated code to file"""
-        # Ensure output directory exists
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Ensure output directory exists, once per output_dir value
+        if self._ready_dir != self.output_dir:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self._ready_dir = self.output_dir
         
         # Determine file extension
         ext = '.tsx' if framework == 'react' else '.vue' if framework == 'vue' else '.ts'
@@ -476,42 +594,17 @@ export default {requirements['component_name']};
         
         return str(file_path)
     
-    def _get_react_templates(self) -> Dict:
-        """Get React component templates"""
-        return {}  # Implemented above in generate methods
-    
-    def _get_vue_templates(self) -> Dict:
-        """Get Vue component templates"""
-        return {}  # Could be implemented for Vue support
-    
-    def _get_angular_templates(self) -> Dict:
-        """Get Angular component templates"""
-        return {}  # Could be implemented for Angular support
-    
-    def _get_tailwind_classes(self) -> Dict:
-        """Get Tailwind CSS class mappings"""
-        return {
-            'colors': {
-                'primary': 'bg-blue-500',
-                'secondary': 'bg-gray-500',
-                'success': 'bg-green-500',
-                'danger': 'bg-red-500',
-                'warning': 'bg-yellow-500',
-                'info': 'bg-blue-400'
-            },
-            'spacing': {
-                'xs': 'p-2',
-                'sm': 'p-4',
-                'md': 'p-6',
-                'lg': 'p-8',
-                'xl': 'p-10'
-            }
-        }
-    
-    def _get_bootstrap_classes(self) -> Dict:
-        """Get Bootstrap class mappings"""
-        return {}  # Could be implemented
-    
-    def _get_material_classes(self) -> Dict:
-        """Get Material Design class mappings"""
-        return {}  # Could be implemented
\ No newline at end of file
+    def save_many(self, items: Iterable[Tuple[str, str, str]]) -> List[str]:
+        """Save several (code, component_name, framework) entries concurrently"""
+        items = list(items)
+        if not items:
+            return []
+        
+        # Only batch saves need threads, so single-prompt runs skip this import
+        from concurrent.futures import ThreadPoolExecutor
+        
+        # Save the first entry inline so the output directory exists before the workers start
+        first = self._save_code(*items[0])
+        with ThreadPoolExecutor(max_workers=min(SAVE_WORKERS, len(items))) as pool:
+            rest = pool.map(lambda item: self._save_code(*item), items[1:])
+            return [first, *rest]
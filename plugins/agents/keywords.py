@@ -0,0 +1,36 @@
+"""
+KeywordScanner - single-pass multi-keyword matching for agent prompts
+"""
+
+import re
+from typing import Hashable, Iterable, Mapping, Set, Union
+
+class KeywordScanner:
+    """Finds every keyword occurring anywhere in a text with one regex pass
+
+    Given a mapping of keyword -> tags instead of plain keywords, scan()
+    reports the union of the tags of every keyword found.
+    """
+
+    def __init__(self, keywords: Union[Iterable[str], Mapping[str, Iterable[Hashable]]]):
+        if isinstance(keywords, Mapping):
+            tags = {keyword: frozenset(keyword_tags) for keyword, keyword_tags in keywords.items()}
+        else:
+            tags = {keyword: frozenset((keyword,)) for keyword in keywords}
+
+        # Longest first, so each position reports its longest matching keyword
+        ordered = sorted(tags, key=len, reverse=True)
+        self._pattern = re.compile('(?=(' + '|'.join(map(re.escape, ordered)) + '))')
+
+        # Any shorter keyword matching at the same position is a prefix of the longest
+        self._prefixes = {
+            keyword: frozenset().union(*(tags[k] for k in ordered if keyword.startswith(k)))
+            for keyword in ordered
+        }
+
+    def scan(self, text: str) -> Set[Hashable]:
+        """Return the keywords (or their tags) that occur in text, same as `keyword in text` for each"""
+        hits: Set[Hashable] = set()
+        for match in self._pattern.finditer(text):
+            hits |= self._prefixes[match.group(1)]
+        return hits
@@ -6,11 +6,86 @@ import re
 import os
 import ast
 import json
-from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass
+from itertools import zip_longest
+from types import MappingProxyType
+from functools import lru_cache
 
-@dataclass
+# Per-line review patterns, compiled once at import time
+
+# Python
+PY_EVAL_RE = re.compile(r'eval\(|exec\(')
+PY_APPEND_RE = re.compile(r'\.append\(.*\)\s*$')
+PY_BARE_EXCEPT_RE = re.compile(r'except:\s*$')
+PY_FOR_RE = re.compile(r'\s*(?:async\s+)?for\s')
+
+# JavaScript / TypeScript / React
+JS_EVAL_RE = re.compile(r'eval\(|innerHTML\s*=')
+JS_VAR_RE = re.compile(r'var\s+\w+')
+JS_DOM_QUERY_RE = re.compile(r'document\.getElementById|document\.querySelector')
+TS_ANY_RE = re.compile(r':\s*any\b')
+TS_FUNCTION_RE = re.compile(r'function\s+\w+\s*\([^)]*\)\s*{')
+TS_ARROW_RETURN_RE = re.compile(r':\s*\w+\s*=>')
+REACT_USE_STATE_RE = re.compile(r'const\s*\[.*,\s*set\w+\]\s*=')
+REACT_MAP_RE = re.compile(r'\.map\s*\(.*=>')
+REACT_IMG_RE = re.compile(r'<img\s+')
+REACT_USE_STATE_CALL_RE = re.compile(r'useState')
+REACT_KEY_PROP_RE = re.compile(r'key=')
+REACT_ALT_PROP_RE = re.compile(r'alt=')
+
+# Go and SQL
+GO_ROUTINE_RE = re.compile(r'go\s+\w+\(')
+SQL_CONCAT_RE = re.compile(r'["\'][^"\']*\+.*["\']')
+
+# All languages
+TODO_RE = re.compile(r'(TODO|FIXME|HACK|XXX)', re.IGNORECASE)
+TODO_WORDS = ('todo', 'fixme', 'hack', 'xxx')
+# The only characters TODO_RE matches case-insensitively that str.lower() does not map onto TODO_WORDS
+TODO_CASE_EXCEPTIONS = ('\u0130', '\u0131')  # dotted capital I, dotless small i
+
+def _any_of(*patterns: str) -> re.Pattern:
+    """Compile one alternation that matches wherever any of the patterns would"""
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns))
+
+# Per-language prefilters: one scan rules out every regex check on a clean line
+PY_LINE_RE = _any_of(PY_EVAL_RE.pattern, PY_APPEND_RE.pattern, PY_BARE_EXCEPT_RE.pattern)
+
+def _mentions_todo(text: str) -> bool:
+    """Same answer as TODO_RE.search(text), using plain substring scans of the lowercased text"""
+    if any(char in text for char in TODO_CASE_EXCEPTIONS):
+        return TODO_RE.search(text) is not None
+    lowered = text.lower()
+    return any(word in lowered for word in TODO_WORDS)
+
+@lru_cache(maxsize=None)
+def _orjson():
+    """Optional orjson module for much faster JSON validation, imported on the first JSON review"""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+def _suffix(file_path: str) -> str:
+    """Path(file_path).suffix without building a Path"""
+    name = os.path.basename(file_path)
+    dot = name.rfind('.')
+    if 0 < dot < len(name) - 1:
+        return name[dot:]
+    return ''
+
+# Files above this size are not read at all
+MAX_REVIEW_BYTES = 5_000_000
+# Python sources above this many characters get line checks only, no AST audit
+MAX_AST_CHARS = 200_000
+# Reviews kept per agent, keyed on file path, mtime and size
+REVIEW_CACHE_SIZE = 128
+
+# Node types that add one decision point to the enclosing function's complexity
+BRANCH_NODE_TYPES = frozenset({ast.If, ast.While, ast.For, ast.AsyncFor, ast.ExceptHandler})
+
+@dataclass(slots=True)
 class Issue:
     type: str  # 'error', 'warning', 'suggestion', 'style'
     line: Optional[int]
@@ -20,45 +95,189 @@ class Issue:
     category: str  # 'security', 'performance', 'maintainability', 'style', 'bug'
     suggestion: Optional[str] = None
 
-class ReviewAgent:
-    """AI-powered code reviewer that analyzes files for issues and improvements"""
+@dataclass(frozen=True)
+class LineRule:
+    """A per-line check: report an issue where pattern matches, unless `unless` also does"""
+    pattern: re.Pattern
+    type: str
+    message: str
+    severity: str
+    category: str
+    unless: Optional[re.Pattern] = None
+
+class LineRuleSet:
+    """Line rules applied in a single pass, behind one prefilter alternation of their patterns"""
+    
+    def __init__(self, *rules: LineRule):
+        self.rules = rules
+        self.prefilter = _any_of(*(rule.pattern.pattern for rule in rules))
+    
+    def extend(self, *rules: LineRule) -> 'LineRuleSet':
+        """Return a new rule set with these rules checked after the current ones"""
+        return LineRuleSet(*self.rules, *rules)
+    
+    def scan(self, lines: List[str]) -> List[Issue]:
+        """Check every line against every rule, in rule order within a line"""
+        issues = []
+        prefilter = self.prefilter.search
+        
+        for i, line in enumerate(lines, 1):
+            if not prefilter(line):
+                continue
+            
+            for rule in self.rules:
+                if rule.pattern.search(line) and not (rule.unless and rule.unless.search(line)):
+                    issues.append(Issue(
+                        type=rule.type,
+                        line=i,
+                        column=None,
+                        message=rule.message,
+                        severity=rule.severity,
+                        category=rule.category
+                    ))
+        
+        return issues
+
+# TypeScript adds to the JavaScript rules and React adds to TypeScript's,
+# so a .tsx file is checked against all three in one pass over its lines
+JS_RULES = LineRuleSet(
+    # Security issues
+    LineRule(JS_EVAL_RE, 'warning', "Potential security risk - avoid eval() or innerHTML", 'high', 'security'),
+    # Modern JS suggestions
+    LineRule(JS_VAR_RE, 'suggestion', "Consider using 'let' or 'const' instead of 'var'", 'low', 'style'),
+    # Performance issues
+    LineRule(JS_DOM_QUERY_RE, 'suggestion', "Consider caching DOM queries for better performance", 'low', 'performance'),
+)
+TS_RULES = JS_RULES.extend(
+    # Type safety
+    LineRule(TS_ANY_RE, 'warning', "Avoid 'any' type - use specific types for better type safety", 'medium', 'maintainability'),
+    # Missing type annotations
+    LineRule(TS_FUNCTION_RE, 'suggestion', "Consider adding return type annotation", 'low', 'maintainability',
+             unless=TS_ARROW_RETURN_RE),
+)
+REACT_RULES = TS_RULES.extend(
+    # React-specific issues
+    LineRule(REACT_USE_STATE_CALL_RE, 'suggestion', "Follow destructuring pattern for useState", 'low', 'style',
+             unless=REACT_USE_STATE_RE),
+    # Missing key prop in lists
+    LineRule(REACT_MAP_RE, 'warning', "Missing 'key' prop in list items", 'medium', 'bug',
+             unless=REACT_KEY_PROP_RE),
+    # Accessibility
+    LineRule(REACT_IMG_RE, 'warning', "Missing 'alt' attribute for accessibility", 'medium', 'maintainability',
+             unless=REACT_ALT_PROP_RE),
+)
+
+class PythonAstAuditor(ast.NodeVisitor):
+    """Single-pass AST audit: missing docstrings and cyclomatic complexity per function"""
     
     def __init__(self):
-        self.supported_extensions = {
-            '.py': self._review_python,
-            '.js': self._review_javascript,
-            '.ts': self._review_typescript,
-            '.jsx': self._review_react,
-            '.tsx': self._review_react,
-            '.go': self._review_go,
-            '.java': self._review_java,
-            '.cpp': self._review_cpp,
-            '.c': self._review_cpp,
-            '.cs': self._review_csharp,
-            '.php': self._review_php,
-            '.rb': self._review_ruby,
-            '.rs': self._review_rust,
-            '.sql': self._review_sql,
-            '.yml': self._review_yaml,
-            '.yaml': self._review_yaml,
-            '.json': self._review_json,
-            '.md': self._review_markdown,
-            '.html': self._review_html,
-            '.css': self._review_css,
+        self.issues: List[Issue] = []
+        # Complexity of each function currently being visited, innermost last
+        self.complexity_stack: List[int] = []
+        # Exact node type -> handler; AST node classes are never subclassed
+        self._handlers = {
+            ast.FunctionDef: self.visit_FunctionDef,
+            ast.AsyncFunctionDef: self.visit_FunctionDef,
+            ast.ClassDef: self.visit_ClassDef,
+            ast.BoolOp: self.visit_BoolOp,
         }
+        self._handlers.update(dict.fromkeys(BRANCH_NODE_TYPES, self._visit_branch))
+    
+    def visit(self, node: ast.AST):
+        handler = self._handlers.get(type(node))
+        if handler is None:
+            self.generic_visit(node)
+        else:
+            handler(node)
+    
+    def generic_visit(self, node: ast.AST):
+        # Dispatch children inline instead of through NodeVisitor's per-node getattr
+        handlers = self._handlers
+        for child in ast.iter_child_nodes(node):
+            handler = handlers.get(type(child))
+            if handler is None:
+                self.generic_visit(child)
+            else:
+                handler(child)
+    
+    def _check_docstring(self, node: ast.AST):
+        if not ast.get_docstring(node):
+            self.issues.append(Issue(
+                type='suggestion',
+                line=node.lineno,
+                column=node.col_offset,
+                message=f"{type(node).__name__} '{node.name}' missing docstring",
+                severity='low',
+                category='maintainability'
+            ))
+    
+    def visit_FunctionDef(self, node: ast.AST):
+        self._check_docstring(node)
+        
+        self.complexity_stack.append(1)  # Base complexity
+        self.generic_visit(node)
+        complexity = self.complexity_stack.pop()
         
+        if complexity > 10:
+            self.issues.append(Issue(
+                type='warning',
+                line=node.lineno,
+                column=node.col_offset,
+                message=f"Function '{node.name}' has high complexity ({complexity})",
+                severity='medium',
+                category='maintainability',
+                suggestion="Consider breaking this function into smaller functions"
+            ))
+    
+    def visit_ClassDef(self, node: ast.ClassDef):
+        self._check_docstring(node)
+        self.generic_visit(node)
+    
+    def _visit_branch(self, node: ast.AST):
+        if self.complexity_stack:
+            self.complexity_stack[-1] += 1
+        self.generic_visit(node)
+    
+    def visit_BoolOp(self, node: ast.BoolOp):
+        if self.complexity_stack:
+            self.complexity_stack[-1] += len(node.values) - 1
+        self.generic_visit(node)
+
+class ReviewAgent:
+    """AI-powered code reviewer that analyzes files for issues and improvements"""
+    
+    def __init__(self):
+        # (path, mtime_ns, size) -> formatted review, oldest first
+        self._results: Dict[Tuple[str, int, int], str] = {}
+    
     def analyze(self, file_path: str) -> str:
         """Analyze a file and return comprehensive review results"""
         
         if not os.path.exists(file_path):
             return f"❌ File not found: {file_path}"
         
-        file_path_obj = Path(file_path)
-        extension = file_path_obj.suffix.lower()
+        extension = _suffix(file_path).lower()
+        review_func = self.supported_extensions.get(extension)
         
-        if extension not in self.supported_extensions:
+        if review_func is None:
             return f"⚠️ Unsupported file type: {extension}"
         
+        # Decide on size before decoding the whole file, and reuse the review of an unchanged one
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            key = None
+            size = 0
+        else:
+            key = (file_path, stat.st_mtime_ns, stat.st_size)
+            size = stat.st_size
+        if size > MAX_REVIEW_BYTES:
+            return f"⚠️ File too large for review ({size // 1024} KB) - skipping"
+        
+        cached = self._results.get(key)
+        if cached is not None:
+            return cached
+        
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
@@ -69,39 +288,61 @@ class ReviewAgent:
             except Exception as e:
                 return f"❌ Error reading file: {e}"
         
+        # Split once; every reviewer and the report share the same lines
+        lines = content.splitlines()
+        
         # Get language-specific review
-        review_func = self.supported_extensions[extension]
-        issues = review_func(content, file_path)
+        issues = review_func(self, content, lines, file_path)
         
         # Add general file analysis
-        issues.extend(self._analyze_general_issues(content, file_path))
+        issues.extend(self._analyze_general_issues(content, lines, file_path))
         
         # Format and return results
-        return self._format_review_results(issues, file_path, content)
+        result = self._format_review_results(issues, file_path, lines)
+        
+        if key is not None:
+            self._results[key] = result
+            if len(self._results) > REVIEW_CACHE_SIZE:
+                del self._results[next(iter(self._results))]
+        
+        return result
     
-    def _review_python(self, content: str, file_path: str) -> List[Issue]:
+    def _review_python(self, content: str, lines: List[str], file_path: str) -> List[Issue]:
         """Review Python code"""
         issues = []
-        lines = content.splitlines()
         
-        # Parse AST for advanced analysis
-        try:
-            tree = ast.parse(content)
-            issues.extend(self._analyze_python_ast(tree))
-        except SyntaxError as e:
+        # Parse AST for advanced analysis, unless the file is big enough to make that the bulk of the review
+        if len(content) > MAX_AST_CHARS:
             issues.append(Issue(
-                type='error',
-                line=e.lineno,
-                column=e.offset,
-                message=f"Syntax error: {e.msg}",
-                severity='high',
-                category='bug'
+                type='suggestion',
+                line=None,
+                column=None,
+                message="File too large for AST analysis - syntax, docstring and complexity checks skipped",
+                severity='low',
+                category='maintainability'
             ))
+        else:
+            try:
+                tree = ast.parse(content)
+                issues.extend(self._analyze_python_ast(tree))
+            except SyntaxError as e:
+                issues.append(Issue(
+                    type='error',
+                    line=e.lineno,
+                    column=e.offset,
+                    message=f"Syntax error: {e.msg}",
+                    severity='high',
+                    category='bug'
+                ))
         
-        # Line-by-line analysis
+        # Line-by-line analysis; the flags track loop headers on the two previous lines
+        prev_for = prev2_for = False
+        has_long_lines = max(map(len, lines), default=0) > 88
         for i, line in enumerate(lines, 1):
+            flagged = PY_LINE_RE.search(line) is not None
+            
             # Security issues
-            if re.search(r'eval\(|exec\(', line):
+            if flagged and PY_EVAL_RE.search(line):
                 issues.append(Issue(
                     type='warning',
                     line=i,
@@ -113,7 +354,7 @@ class ReviewAgent:
                 ))
             
             # Performance issues
-            if re.search(r'\.append\(.*\)\s*$', line) and 'for' in lines[max(0, i-2):i]:
+            if flagged and (prev_for or prev2_for) and PY_APPEND_RE.search(line):
                 issues.append(Issue(
                     type='suggestion',
                     line=i,
@@ -124,7 +365,7 @@ class ReviewAgent:
                 ))
             
             # Style issues
-            if len(line) > 88:  # PEP 8 recommends 79, but 88 is common with black
+            if has_long_lines and len(line) > 88:  # PEP 8 recommends 79, but 88 is common with black
                 issues.append(Issue(
                     type='style',
                     line=i,
@@ -135,7 +376,7 @@ class ReviewAgent:
                 ))
             
             # Common anti-patterns
-            if re.search(r'except:\s*$', line):
+            if flagged and PY_BARE_EXCEPT_RE.search(line):
                 issues.append(Issue(
                     type='warning',
                     line=i,
@@ -144,180 +385,37 @@ class ReviewAgent:
                     severity='medium',
                     category='maintainability'
                 ))
+            
+            prev2_for, prev_for = prev_for, PY_FOR_RE.match(line) is not None
         
         return issues
     
     def _analyze_python_ast(self, tree: ast.AST) -> List[Issue]:
         """Analyze Python AST for advanced issues"""
-        issues = []
-        
-        for node in ast.walk(tree):
-            # Check for unused variables
-            if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
-                # This would need more sophisticated analysis
-                pass
-            
-            # Check for missing docstrings
-            if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
-                if not ast.get_docstring(node):
-                    issues.append(Issue(
-                        type='suggestion',
-                        line=node.lineno,
-                        column=node.col_offset,
-                        message=f"{type(node).__name__} '{node.name}' missing docstring",
-                        severity='low',
-                        category='maintainability'
-                    ))
-            
-            # Check for complex functions
-            if isinstance(node, ast.FunctionDef):
-                complexity = self._calculate_cyclomatic_complexity(node)
-                if complexity > 10:
-                    issues.append(Issue(
-                        type='warning',
-                        line=node.lineno,
-                        column=node.col_offset,
-                        message=f"Function '{node.name}' has high complexity ({complexity})",
-                        severity='medium',
-                        category='maintainability',
-                        suggestion="Consider breaking this function into smaller functions"
-                    ))
-        
-        return issues
-    
-    def _calculate_cyclomatic_complexity(self, node: ast.FunctionDef) -> int:
-        """Calculate cyclomatic complexity of a function"""
-        complexity = 1  # Base complexity
-        
-        for child in ast.walk(node):
-            if isinstance(child, (ast.If, ast.While, ast.For, ast.ExceptHandler)):
-                complexity += 1
-            elif isinstance(child, ast.BoolOp):
-                complexity += len(child.values) - 1
-        
-        return complexity
+        auditor = PythonAstAuditor()
+        auditor.visit(tree)
+        return auditor.issues
     
-    def _review_javascript(self, content: str, file_path: str) -> List[Issue]:
+    def _review_javascript(self, content: str, lines: List[str], file_path: str) -> List[Issue]:
         """Review JavaScript code"""
-        issues = []
-        lines = content.splitlines()
-        
-        for i, line in enumerate(lines, 1):
-            # Security issues
-            if re.search(r'eval\(|innerHTML\s*=', line):
-                issues.append(Issue(
-                    type='warning',
-                    line=i,
-                    column=None,
-                    message="Potential security risk - avoid eval() or innerHTML",
-                    severity='high',
-                    category='security'
-                ))
-            
-            # Modern JS suggestions
-            if re.search(r'var\s+\w+', line):
-                issues.append(Issue(
-                    type='suggestion',
-                    line=i,
-                    column=None,
-                    message="Consider using 'let' or 'const' instead of 'var'",
-                    severity='low',
-                    category='style'
-                ))
-            
-            # Performance issues
-            if re.search(r'document\.getElementById|document\.querySelector', line):
-                issues.append(Issue(
-                    type='suggestion',
-                    line=i,
-                    column=None,
-                    message="Consider caching DOM queries for better performance",
-                    severity='low',
-                    category='performance'
-                ))
-        
-        return issues
+        return JS_RULES.scan(lines)
     
-    def _review_typescript(self, content: str, file_path: str) -> List[Issue]:
+    def _review_typescript(self, content: str, lines: List[str], file_path: str) -> List[Issue]:
         """Review TypeScript code"""
-        issues = self._review_javascript(content, file_path)  # Inherit JS rules
-        lines = content.splitlines()
-        
-        for i, line in enumerate(lines, 1):
-            # Type safety
-            if re.search(r':\s*any\b', line):
-                issues.append(Issue(
-                    type='warning',
-                    line=i,
-                    column=None,
-                    message="Avoid 'any' type - use specific types for better type safety",
-                    severity='medium',
-                    category='maintainability'
-                ))
-            
-            # Missing type annotations
-            if re.search(r'function\s+\w+\s*\([^)]*\)\s*{', line):
-                if not re.search(r':\s*\w+\s*=>', line):
-                    issues.append(Issue(
-                        type='suggestion',
-                        line=i,
-                        column=None,
-                        message="Consider adding return type annotation",
-                        severity='low',
-                        category='maintainability'
-                    ))
-        
-        return issues
+        return TS_RULES.scan(lines)  # JS rules included
     
-    def _review_react(self, content: str, file_path: str) -> List[Issue]:
+    def _review_react(self, content: str, lines: List[str], file_path: str) -> List[Issue]:
         """Review React/JSX code"""
-        issues = self._review_typescript(content, file_path)
-        lines = content.splitlines()
-        
-        for i, line in enumerate(lines, 1):
-            # React-specific issues
-            if 'useState' in line and not re.search(r'const\s*\[.*,\s*set\w+\]\s*=', line):
-                issues.append(Issue(
-                    type='suggestion',
-                    line=i,
-                    column=None,
-                    message="Follow destructuring pattern for useState",
-                    severity='low',
-                    category='style'
-                ))
-            
-            # Missing key prop in lists
-            if re.search(r'\.map\s*\(.*=>', line) and 'key=' not in line:
-                issues.append(Issue(
-                    type='warning',
-                    line=i,
-                    column=None,
-                    message="Missing 'key' prop in list items",
-                    severity='medium',
-                    category='bug'
-                ))
-            
-            # Accessibility
-            if re.search(r'<img\s+', line) and 'alt=' not in line:
-                issues.append(Issue(
-                    type='warning',
-                    line=i,
-                    column=None,
-                    message="Missing 'alt' attribute for accessibility",
-                    severity='medium',
-                    category='maintainability'
-                ))
-        
-        return issues
+        return REACT_RULES.scan(lines)  # JS and TS rules included
     
-    def _review_go(self, content: str, file_path: str) -> List[Issue]:
+    def _review_go(self, content: str, lines: List[str], file_path: str) -> List[Issue]:
         """Review Go code"""
         issues = []
-        lines = content.splitlines()
         
-        for i, line in enumerate(lines, 1):
+        # Pair each line with the next one; the last line has none
+        for i, (line, next_line) in enumerate(zip_longest(lines, lines[1:]), 1):
             # Error handling
-            if 'err != nil' in line and i < len(lines) and 'return' not in lines[i]:
+            if 'err != nil' in line and next_line is not None and 'return' not in next_line:
                 issues.append(Issue(
                     type='warning',
                     line=i,
@@ -328,7 +426,7 @@ class ReviewAgent:
                 ))
             
             # Goroutine without proper synchronization
-            if re.search(r'go\s+\w+\(', line):
+            if GO_ROUTINE_RE.search(line):
                 issues.append(Issue(
                     type='suggestion',
                     line=i,
@@ -340,14 +438,14 @@ class ReviewAgent:
         
         return issues
     
-    def _review_java(self, content: str, file_path: str) -> List[Issue]:
+    def _review_java(self, content: str, lines: List[str], file_path: str) -> List[Issue]:
         """Review Java code"""
         issues = []
-        lines = content.splitlines()
         
-        for i, line in enumerate(lines, 1):
+        # Pair each line with the next one; the last line has none
+        for i, (line, next_line) in enumerate(zip_longest(lines, lines[1:], fillvalue=''), 1):
             # Exception handling
-            if 'catch' in line and 'printStackTrace' in lines[min(i, len(lines)-1)]:
+            if 'catch' in line and 'printStackTrace' in next_line:
                 issues.append(Issue(
                     type='warning',
                     line=i+1,
@@ -359,16 +457,15 @@ class ReviewAgent:
         
         return issues
     
-    def _review_sql(self, content: str, file_path: str) -> List[Issue]:
+    def _review_sql(self, content: str, lines: List[str], file_path: str) -> List[Issue]:
         """Review SQL code"""
         issues = []
-        lines = content.splitlines()
         
         for i, line in enumerate(lines, 1):
             line_upper = line.upper()
             
             # SQL injection risks
-            if re.search(r'["\'][^"\']*\+.*["\']', line):
+            if SQL_CONCAT_RE.search(line):
                 issues.append(Issue(
                     type='warning',
                     line=i,
@@ -391,31 +488,39 @@ class ReviewAgent:
         
         return issues
     
-    def _review_generic(self, content: str, file_path: str) -> List[Issue]:
+    def _review_generic(self, content: str, lines: List[str], file_path: str) -> List[Issue]:
         """Generic review for unsupported file types"""
         return []
     
     # Placeholder methods for other languages
-    def _review_cpp(self, content: str, file_path: str) -> List[Issue]:
-        return self._review_generic(content, file_path)
+    def _review_cpp(self, content: str, lines: List[str], file_path: str) -> List[Issue]:
+        return self._review_generic(content, lines, file_path)
     
-    def _review_csharp(self, content: str, file_path: str) -> List[Issue]:
-        return self._review_generic(content, file_path)
+    def _review_csharp(self, content: str, lines: List[str], file_path: str) -> List[Issue]:
+        return self._review_generic(content, lines, file_path)
     
-    def _review_php(self, content: str, file_path: str) -> List[Issue]:
-        return self._review_generic(content, file_path)
+    def _review_php(self, content: str, lines: List[str], file_path: str) -> List[Issue]:
+        return self._review_generic(content, lines, file_path)
     
-    def _review_ruby(self, content: str, file_path: str) -> List[Issue]:
-        return self._review_generic(content, file_path)
+    def _review_ruby(self, content: str, lines: List[str], file_path: str) -> List[Issue]:
+        return self._review_generic(content, lines, file_path)
     
-    def _review_rust(self, content: str, file_path: str) -> List[Issue]:
-        return self._review_generic(content, file_path)
+    def _review_rust(self, content: str, lines: List[str], file_path: str) -> List[Issue]:
+        return self._review_generic(content, lines, file_path)
     
-    def _review_yaml(self, content: str, file_path: str) -> List[Issue]:
-        return self._review_generic(content, file_path)
+    def _review_yaml(self, content: str, lines: List[str], file_path: str) -> List[Issue]:
+        return self._review_generic(content, lines, file_path)
     
-    def _review_json(self, content: str, file_path: str) -> List[Issue]:
+    def _review_json(self, content: str, lines: List[str], file_path: str) -> List[Issue]:
         issues = []
+        orjson = _orjson()
+        if orjson is not None:
+            try:
+                orjson.loads(content)
+                return issues
+            except orjson.JSONDecodeError:
+                # orjson is stricter (NaN, huge ints); let json decide and report the position
+                pass
         try:
             json.loads(content)
         except json.JSONDecodeError as e:
@@ -429,19 +534,42 @@ class ReviewAgent:
             ))
         return issues
     
-    def _review_markdown(self, content: str, file_path: str) -> List[Issue]:
-        return self._review_generic(content, file_path)
+    def _review_markdown(self, content: str, lines: List[str], file_path: str) -> List[Issue]:
+        return self._review_generic(content, lines, file_path)
+    
+    def _review_html(self, content: str, lines: List[str], file_path: str) -> List[Issue]:
+        return self._review_generic(content, lines, file_path)
     
-    def _review_html(self, content: str, file_path: str) -> List[Issue]:
-        return self._review_generic(content, file_path)
+    def _review_css(self, content: str, lines: List[str], file_path: str) -> List[Issue]:
+        return self._review_generic(content, lines, file_path)
     
-    def _review_css(self, content: str, file_path: str) -> List[Issue]:
-        return self._review_generic(content, file_path)
+    # Extension -> reviewing function, shared by every instance and called with self explicitly
+    supported_extensions = MappingProxyType({
+        '.py': _review_python,
+        '.js': _review_javascript,
+        '.ts': _review_typescript,
+        '.jsx': _review_react,
+        '.tsx': _review_react,
+        '.go': _review_go,
+        '.java': _review_java,
+        '.cpp': _review_cpp,
+        '.c': _review_cpp,
+        '.cs': _review_csharp,
+        '.php': _review_php,
+        '.rb': _review_ruby,
+        '.rs': _review_rust,
+        '.sql': _review_sql,
+        '.yml': _review_yaml,
+        '.yaml': _review_yaml,
+        '.json': _review_json,
+        '.md': _review_markdown,
+        '.html': _review_html,
+        '.css': _review_css,
+    })
     
-    def _analyze_general_issues(self, content: str, file_path: str) -> List[Issue]:
+    def _analyze_general_issues(self, content: str, lines: List[str], file_path: str) -> List[Issue]:
         """Analyze general file issues"""
         issues = []
-        lines = content.splitlines()
         
         # File size check
         if len(content) > 50000:  # 50KB
@@ -454,44 +582,48 @@ class ReviewAgent:
                 category='maintainability'
             ))
         
-        # Long lines in any language
-        for i, line in enumerate(lines, 1):
-            if len(line) > 120:
-                issues.append(Issue(
-                    type='style',
-                    line=i,
-                    column=None,
-                    message="Line exceeds 120 characters",
-                    severity='low',
-                    category='style'
-                ))
+        # Long lines and TODO/FIXME comments in any language, in one pass over the lines.
+        # Most files have neither, so check the longest line and the whole text first
+        has_long_lines = max(map(len, lines), default=0) > 120
+        has_todos = _mentions_todo(content)
         
-        # TODO/FIXME comments
-        for i, line in enumerate(lines, 1):
-            if re.search(r'(TODO|FIXME|HACK|XXX)', line, re.IGNORECASE):
-                issues.append(Issue(
-                    type='suggestion',
-                    line=i,
-                    column=None,
-                    message="TODO/FIXME comment found - consider addressing",
-                    severity='low',
-                    category='maintainability'
-                ))
+        if has_long_lines or has_todos:
+            for i, line in enumerate(lines, 1):
+                if has_long_lines and len(line) > 120:
+                    issues.append(Issue(
+                        type='style',
+                        line=i,
+                        column=None,
+                        message="Line exceeds 120 characters",
+                        severity='low',
+                        category='style'
+                    ))
+                
+                if has_todos and len(line) >= 3 and TODO_RE.search(line):
+                    issues.append(Issue(
+                        type='suggestion',
+                        line=i,
+                        column=None,
+                        message="TODO/FIXME comment found - consider addressing",
+                        severity='low',
+                        category='maintainability'
+                    ))
         
         return issues
     
-    def _format_review_results(self, issues: List[Issue], file_path: str, content: str) -> str:
+    def _format_review_results(self, issues: List[Issue], file_path: str, lines: List[str]) -> str:
         """Format the review results into a readable report"""
         if not issues:
             return f"✅ **{os.path.basename(file_path)}** - No issues found! Code looks good."
         
-        # Group issues by severity
-        errors = [i for i in issues if i.type == 'error']
-        warnings = [i for i in issues if i.type == 'warning']
-        suggestions = [i for i in issues if i.type == 'suggestion']
-        style_issues = [i for i in issues if i.type == 'style']
+        # Group issues by severity in one pass
+        errors, warnings, suggestions, style_issues = [], [], [], []
+        buckets = {'error': errors, 'warning': warnings, 'suggestion': suggestions, 'style': style_issues}
+        for issue in issues:
+            bucket = buckets.get(issue.type)
+            if bucket is not None:
+                bucket.append(issue)
         
-        lines = content.splitlines()
         result = [f"📋 **Code Review: {os.path.basename(file_path)}**"]
         result.append("=" * 50)
         
@@ -547,4 +679,4 @@ class ReviewAgent:
         else:
             result.append("✨ **Excellent** - No issues found!")
         
-        return "\\n".join(result)
\ No newline at end of file
+        return "\n".join(result)
\ No newline at end of file
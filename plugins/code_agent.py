@@ -7,54 +7,81 @@ Generates, refactors, and explains code using AI assistance
 import sys
 import argparse
 import os
-from pathlib import Path
 
-# Add current directory to Python path for imports
-current_dir = Path(__file__).parent
-sys.path.insert(0, str(current_dir))
-
-try:
-    from agents.coder import CoderAgent
-except ImportError as e:
-    print(f"❌ Failed to import CoderAgent: {e}")
-    sys.exit(1)
-
-def main():
-    parser = argparse.ArgumentParser(
-        description="Generate, refactor, and explain code using AI assistance",
-        prog="code"
-    )
-    
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-    
-    # Generate command
-    gen_parser = subparsers.add_parser("generate", aliases=["gen"], help="Generate code from description")
+def _add_generate_arguments(gen_parser: argparse.ArgumentParser):
     gen_parser.add_argument("description", nargs="*", help="Description of code to generate")
     gen_parser.add_argument("--prompt", help="Alternative way to specify description")
     gen_parser.add_argument("--language", "--lang", choices=["python", "javascript", "go", "java", "rust"], help="Programming language")
     gen_parser.add_argument("--output", "-o", help="Output file path")
     gen_parser.add_argument("--type", choices=["function", "class", "script", "api"], help="Type of code to generate")
-    
-    # Refactor command
-    ref_parser = subparsers.add_parser("refactor", aliases=["ref"], help="Refactor existing code")
+
+def _add_refactor_arguments(ref_parser: argparse.ArgumentParser):
     ref_parser.add_argument("file", help="File to refactor")
     ref_parser.add_argument("--type", choices=["improve", "optimize", "modernize"], default="improve", help="Type of refactoring")
     ref_parser.add_argument("--output", "-o", help="Output file (default: overwrite original)")
     ref_parser.add_argument("--backup", action="store_true", help="Create backup of original file")
-    
-    # Explain command
-    exp_parser = subparsers.add_parser("explain", aliases=["exp"], help="Explain what code does")
+
+def _add_explain_arguments(exp_parser: argparse.ArgumentParser):
     exp_parser.add_argument("target", help="File path or code snippet to explain")
     exp_parser.add_argument("--format", choices=["markdown", "plain"], default="plain", help="Output format")
-    
-    # Review command (alias for explain)
-    rev_parser = subparsers.add_parser("review", help="Review and explain code")
+
+def _add_review_arguments(rev_parser: argparse.ArgumentParser):
     rev_parser.add_argument("file", help="File to review")
+
+# name -> (aliases, help, argument builder)
+SUBCOMMANDS = {
+    "generate": (["gen"], "Generate code from description", _add_generate_arguments),
+    "refactor": (["ref"], "Refactor existing code", _add_refactor_arguments),
+    "explain": (["exp"], "Explain what code does", _add_explain_arguments),
+    "review": ([], "Review and explain code", _add_review_arguments),  # alias for explain
+}
+
+# Every spelling accepted on the command line -> subcommand name
+COMMAND_NAMES = {
+    alias: name
+    for name, (aliases, _, _) in SUBCOMMANDS.items()
+    for alias in [name, *aliases]
+}
+
+def build_parser() -> argparse.ArgumentParser:
+    """Full parser with every subcommand, used for top-level help and errors"""
+    parser = argparse.ArgumentParser(
+        description="Generate, refactor, and explain code using AI assistance",
+        prog="code"
+    )
+    
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    for name, (aliases, help_text, add_arguments) in SUBCOMMANDS.items():
+        add_arguments(subparsers.add_parser(name, aliases=aliases, help=help_text))
     
-    args = parser.parse_args()
+    return parser
+
+def parse_args(argv: list) -> argparse.Namespace:
+    """Parse argv, building only the parser of the subcommand being run when there is one"""
+    if argv and argv[0] in COMMAND_NAMES:
+        name = COMMAND_NAMES[argv[0]]
+        parser = argparse.ArgumentParser(prog=f"code {name}")
+        SUBCOMMANDS[name][2](parser)
+        args = parser.parse_args(argv[1:])
+        args.command = argv[0]
+        return args
+    
+    return build_parser().parse_args(argv)
+
+def main():
+    args = parse_args(sys.argv[1:])
     
     if not args.command:
-        parser.print_help()
+        build_parser().print_help()
+        sys.exit(1)
+    
+    # Import the agent only once the arguments are valid, so help and usage errors stay cheap
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    
+    try:
+        from agents.coder import CoderAgent
+    except ImportError as e:
+        print(f"❌ Failed to import CoderAgent: {e}")
         sys.exit(1)
     
     try:
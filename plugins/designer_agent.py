@@ -5,21 +5,36 @@ Generates UI code from natural language descriptions
 """
 
 import sys
-import argparse
 import os
-from pathlib import Path
 
-# Add current directory to Python path for imports
-current_dir = Path(__file__).parent
-sys.path.insert(0, str(current_dir))
+DEFAULT_OUTPUT_DIR = "snapmethod/exports"
 
-try:
-    from agents.designer import DesignerAgent
-except ImportError as e:
-    print(f"❌ Failed to import DesignerAgent: {e}")
-    sys.exit(1)
+# Pre-rendered `-h` output (argparse, 80 columns) so plain help skips building the parser.
+# Keep in sync with the arguments in build_parser().
+HELP = """\
+usage: design [-h] [--prompt PROMPT] [--framework {react,vue,angular}]
+              [--output-dir OUTPUT_DIR] [--preview]
+              [description ...]
 
-def main():
+Generate UI code from natural language descriptions
+
+positional arguments:
+  description           Description of the UI component to generate
+
+options:
+  -h, --help            show this help message and exit
+  --prompt PROMPT       Alternative way to specify the UI description
+  --framework {react,vue,angular}
+                        UI framework to use (default: react)
+  --output-dir OUTPUT_DIR
+                        Output directory for generated code
+  --preview             Show generated code without saving to file
+"""
+
+def build_parser():
+    """Full argparse parser; keep defaults in sync with parse_args()"""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Generate UI code from natural language descriptions",
         prog="design"
@@ -41,7 +56,7 @@ def main():
     )
     parser.add_argument(
         "--output-dir",
-        default="snapmethod/exports",
+        default=DEFAULT_OUTPUT_DIR,
         help="Output directory for generated code"
     )
     parser.add_argument(
@@ -50,7 +65,22 @@ def main():
         help="Show generated code without saving to file"
     )
     
-    args = parser.parse_args()
+    return parser
+
+def parse_args(argv: list):
+    """Parse argv; with positional words only, the common case, skip loading argparse"""
+    if not any(arg.startswith("-") for arg in argv):
+        from types import SimpleNamespace
+        return SimpleNamespace(description=argv, prompt=None, framework="react", output_dir=DEFAULT_OUTPUT_DIR, preview=False)
+    
+    return build_parser().parse_args(argv)
+
+def main():
+    if sys.argv[1:] in (["-h"], ["--help"]):
+        sys.stdout.write(HELP)
+        return
+    
+    args = parse_args(sys.argv[1:])
     
     # Get the description from either positional args or --prompt
     if args.prompt:
@@ -62,23 +92,30 @@ def main():
         print("Usage: design \"dark login page with neon glow\"")
         sys.exit(1)
     
-    if not description.strip():
+    prompt = description.strip()
+    if not prompt:
         print("❌ Error: UI description cannot be empty")
         sys.exit(1)
     
+    # Import the agent only once the arguments are valid, so help and usage errors stay cheap
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    
+    try:
+        from agents.designer import DesignerAgent
+    except ImportError as e:
+        print(f"❌ Failed to import DesignerAgent: {e}")
+        sys.exit(1)
+    
     try:
         # Initialize the designer agent
         agent = DesignerAgent()
         
-        # Override output directory if specified
-        if args.output_dir != "snapmethod/exports":
-            agent.output_dir = Path(args.output_dir)
-        
         # Generate the UI code
         print(f"🎨 Generating UI component: {description}")
         print(f"📋 Framework: {args.framework.capitalize()}")
         
-        code = agent.generate(description.strip())
+        # Render without saving; only a non-preview run writes the file, once
+        component_name, _, code = agent.render(prompt)
         
         if not code:
             print(f"⚠️  Failed to generate code for: {description}")
@@ -90,16 +127,20 @@ def main():
             print("=" * 60)
             print(code)
         else:
-            # Code is already saved by the agent, just show success message
-            output_file = agent._save_code(code, agent._parse_prompt(description)['component_name'], args.framework)
+            # Only a saving run needs the output directory; the agent creates it on first save
+            if args.output_dir != DEFAULT_OUTPUT_DIR:
+                from pathlib import Path
+                agent.output_dir = Path(args.output_dir)
+            
+            output_file = agent._save_code(code, component_name, args.framework)
             print(f"✅ UI component generated successfully!")
             print(f"📁 Saved to: {output_file}")
             print(f"🚀 Component ready for use in your {args.framework} project")
     
     except Exception as e:
         print(f"❌ Error generating UI: {e}")
-        import traceback
         if os.getenv('DEBUG'):
+            import traceback
             print("Debug traceback:")
             traceback.print_exc()
         sys.exit(1)
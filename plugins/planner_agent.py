@@ -5,26 +5,34 @@ Breaks down high-level goals into actionable tasks
 """
 
 import sys
-import argparse
 import os
-from pathlib import Path
 
 # Fix Windows console encoding issues
 if sys.platform == 'win32':
-    import codecs
-    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.detach())
+    sys.stdout.reconfigure(encoding='utf-8')
 
-# Add current directory to Python path for imports
-current_dir = Path(__file__).parent
-sys.path.insert(0, str(current_dir))
+# Pre-rendered `-h` output (argparse, 80 columns) so plain help skips building the parser.
+# Keep in sync with the arguments in build_parser().
+HELP = """\
+usage: plan [-h] [--prompt PROMPT] [--format {simple,detailed,json}]
+            [goal ...]
 
-try:
-    from agents.planner import PlannerAgent
-except ImportError as e:
-    print(f"❌ Failed to import PlannerAgent: {e}")
-    sys.exit(1)
+Break down a goal into actionable tasks using AI planning
 
-def main():
+positional arguments:
+  goal                  The goal to break down into tasks
+
+options:
+  -h, --help            show this help message and exit
+  --prompt PROMPT       Alternative way to specify the goal
+  --format {simple,detailed,json}
+                        Output format
+"""
+
+def build_parser():
+    """Full argparse parser; keep defaults in sync with parse_args()"""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Break down a goal into actionable tasks using AI planning",
         prog="plan"
@@ -45,7 +53,22 @@ def main():
         help="Output format"
     )
     
-    args = parser.parse_args()
+    return parser
+
+def parse_args(argv: list):
+    """Parse argv; with positional words only, the common case, skip loading argparse"""
+    if not any(arg.startswith("-") for arg in argv):
+        from types import SimpleNamespace
+        return SimpleNamespace(goal=argv, prompt=None, format="simple")
+    
+    return build_parser().parse_args(argv)
+
+def main():
+    if sys.argv[1:] in (["-h"], ["--help"]):
+        sys.stdout.write(HELP)
+        return
+    
+    args = parse_args(sys.argv[1:])
     
     # Get the goal from either positional args or --prompt
     if args.prompt:
@@ -57,16 +80,26 @@ def main():
         print("Usage: plan \"build a web app\" or plan --prompt \"create API\"")
         sys.exit(1)
     
-    if not goal.strip():
+    prompt = goal.strip()
+    if not prompt:
         print("ERROR: Goal cannot be empty")
         sys.exit(1)
     
+    # Import the agent only once the arguments are valid, so help and usage errors stay cheap
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    
+    try:
+        from agents.planner import PlannerAgent
+    except ImportError as e:
+        print(f"❌ Failed to import PlannerAgent: {e}")
+        sys.exit(1)
+    
     try:
         # Initialize the planner agent
         agent = PlannerAgent()
         
         # Generate the plan
-        tasks = agent.run(goal.strip())
+        tasks = agent.run(prompt)
         
         if not tasks:
             print(f"WARNING: No tasks generated for goal: {goal}")
@@ -82,19 +115,21 @@ def main():
             }
             print(json.dumps(output, indent=2))
         elif args.format == "detailed":
-            print(f">> GOAL: {goal}")
-            print("=" * 60)
-            print(f">> IMPLEMENTATION PLAN ({len(tasks)} tasks):")
-            print()
-            for i, task in enumerate(tasks, 1):
-                print(f"{i:2d}. {task}")
-            print()
-            print(">> Ready to start development!")
+            # Build the whole plan and write it in one go rather than a print per line
+            lines = [
+                f">> GOAL: {goal}",
+                "=" * 60,
+                f">> IMPLEMENTATION PLAN ({len(tasks)} tasks):",
+                "",
+            ]
+            lines.extend(f"{i:2d}. {task}" for i, task in enumerate(tasks, 1))
+            lines.append("")
+            lines.append(">> Ready to start development!")
+            print("\n".join(lines))
         else:  # simple format (default)
-            print(f">> GOAL: {goal}")
-            print(f">> PLAN ({len(tasks)} tasks):")
-            for task in tasks:
-                print(f"   {task}")
+            lines = [f">> GOAL: {goal}", f">> PLAN ({len(tasks)} tasks):"]
+            lines.extend(f"   {task}" for task in tasks)
+            print("\n".join(lines))
     
     except Exception as e:
         print(f"ERROR: Error generating plan: {e}")
@@ -5,21 +5,50 @@ Analyzes code files and provides improvement suggestions
 """
 
 import sys
-import argparse
 import os
-from pathlib import Path
+import stat
 
-# Add current directory to Python path for imports
-current_dir = Path(__file__).parent
-sys.path.insert(0, str(current_dir))
+# Pre-rendered `-h` output (argparse, 80 columns) so plain help skips building the parser.
+# Keep in sync with the arguments in build_parser().
+HELP = """\
+usage: review [-h] [--file FILE_PATH] [--format {markdown,plain,json}]
+              [--severity {all,high,medium,low}]
+              [--category {all,security,performance,maintainability,style,bug}]
+              [file]
 
-try:
-    from agents.reviewer import ReviewAgent
-except ImportError as e:
-    print(f"❌ Failed to import ReviewAgent: {e}")
-    sys.exit(1)
+Analyze code files and provide improvement suggestions
 
-def main():
+positional arguments:
+  file                  Path to the file to review
+
+options:
+  -h, --help            show this help message and exit
+  --file FILE_PATH      Alternative way to specify the file path
+  --format {markdown,plain,json}
+                        Output format (default: plain)
+  --severity {all,high,medium,low}
+                        Minimum severity level to show
+  --category {all,security,performance,maintainability,style,bug}
+                        Filter by issue category
+"""
+
+def _existing_file(path: str) -> str:
+    """argparse type: absolute path of an existing regular file, checked with a single stat"""
+    import argparse
+    
+    path = os.path.abspath(path)
+    try:
+        mode = os.stat(path).st_mode
+    except OSError:
+        raise argparse.ArgumentTypeError(f"File not found: {path}")
+    if not stat.S_ISREG(mode):
+        raise argparse.ArgumentTypeError(f"Path is not a file: {path}")
+    return path
+
+def build_parser():
+    """Full argparse parser; keep defaults in sync with parse_args()"""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Analyze code files and provide improvement suggestions",
         prog="review"
@@ -27,11 +56,13 @@ def main():
     parser.add_argument(
         "file",
         nargs="?",
+        type=_existing_file,
         help="Path to the file to review"
     )
     parser.add_argument(
         "--file",
         dest="file_path",
+        type=_existing_file,
         help="Alternative way to specify the file path"
     )
     parser.add_argument(
@@ -53,9 +84,27 @@ def main():
         help="Filter by issue category"
     )
     
-    args = parser.parse_args()
+    return parser
+
+def parse_args(argv: list):
+    """Parse argv; a lone existing file, the common case, skips loading argparse"""
+    if len(argv) <= 1 and not any(arg.startswith("-") for arg in argv):
+        file = os.path.abspath(argv[0]) if argv else None
+        if file is None or os.path.isfile(file):
+            from types import SimpleNamespace
+            return SimpleNamespace(file=file, file_path=None, format="plain", severity="all", category="all")
+    
+    # Options, or a path argparse has to reject
+    return build_parser().parse_args(argv)
+
+def main():
+    if sys.argv[1:] in (["-h"], ["--help"]):
+        sys.stdout.write(HELP)
+        return
     
-    # Get the file path from either positional arg or --file
+    args = parse_args(sys.argv[1:])
+    
+    # Get the file path from either positional arg or --file, already absolute and checked
     file_path = args.file or args.file_path
     
     if not file_path:
@@ -63,24 +112,20 @@ def main():
         print("Usage: review <file_path> or review --file <file_path>")
         sys.exit(1)
     
-    # Convert to absolute path if relative
-    file_path = os.path.abspath(file_path)
-    
-    if not os.path.exists(file_path):
-        print(f"❌ Error: File not found: {file_path}")
-        sys.exit(1)
+    # Import the agent only once the arguments are valid, so help and usage errors stay cheap
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
     
-    if not os.path.isfile(file_path):
-        print(f"❌ Error: Path is not a file: {file_path}")
+    try:
+        from agents.reviewer import ReviewAgent
+    except ImportError as e:
+        print(f"❌ Failed to import ReviewAgent: {e}")
         sys.exit(1)
     
     try:
         # Initialize the review agent
         agent = ReviewAgent()
         
-        print(f"🔍 Reviewing file: {os.path.basename(file_path)}")
-        print(f"📁 Path: {file_path}")
-        print()
+        print(f"🔍 Reviewing file: {os.path.basename(file_path)}\n📁 Path: {file_path}\n")
         
         # Analyze the file
         review_result = agent.analyze(file_path)
@@ -100,23 +145,13 @@ def main():
                 "format": "text"
             }
             print(json.dumps(output, indent=2))
-        elif args.format == "markdown":
-            # Convert plain text markers to markdown
-            markdown_result = review_result
-            markdown_result = markdown_result.replace("**", "**")  # Keep bold
-            markdown_result = markdown_result.replace("✅", "✅")   # Keep emojis
-            markdown_result = markdown_result.replace("❌", "❌")
-            markdown_result = markdown_result.replace("⚠️", "⚠️")
-            markdown_result = markdown_result.replace("💡", "💡")
-            markdown_result = markdown_result.replace("🎨", "🎨")
-            print(markdown_result)
-        else:  # plain format (default)
+        else:  # plain (default) and markdown: the report is already markdown
             print(review_result)
     
     except Exception as e:
         print(f"❌ Error reviewing file: {e}")
-        import traceback
         if os.getenv('DEBUG'):
+            import traceback
             print("Debug traceback:")
             traceback.print_exc()
         sys.exit(1)